@@ -0,0 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.calibration.co2 import co2_cal
+from src.calibration.data_loader import load_aircok_file
+from src.calibration.options import DEFAULT_FIT_WORKERS
+from src.calibration.pm import pm_cal, resolve_xgb_profile
+from src.calibration.resample import RESAMPLE_AGG
+from src.calibration.temp_humi import temp_humi_cal
+
+# 워커 프로세스마다 한 번만 받아 두는 기준 데이터 (작업마다 다시 pickle 하지 않도록)
+_worker_reference = None
+
+
+def calibrate_aircok_file(aircok_file, grimm_file, testo_file, wolfsense_file, reference, agg=RESAMPLE_AGG,
+                          fit_workers=1, xgb_profile=None):
+    file_result = {}
+    aircok = load_aircok_file(aircok_file)
+    if grimm_file:
+        file_result.update(pm_cal(grimm_file, aircok_file, grimm=reference["grimm"], aircok=aircok, agg=agg,
+                                  fit_workers=fit_workers, xgb_profile=xgb_profile))
+    if testo_file:
+        file_result.update(temp_humi_cal(testo_file, aircok_file, testo=reference["testo"], aircok=aircok, agg=agg))
+    if wolfsense_file:
+        file_result.update(co2_cal(wolfsense_file, aircok_file, co2_data=reference["wolfsense"], aircok=aircok, agg=agg))
+    return file_result
+
+
+def _init_worker(reference):
+    global _worker_reference
+    _worker_reference = reference
+
+
+def _calibrate_in_worker(aircok_file, grimm_file, testo_file, wolfsense_file, agg, xgb_profile):
+    return calibrate_aircok_file(aircok_file, grimm_file, testo_file, wolfsense_file, _worker_reference, agg,
+                                 xgb_profile=xgb_profile)
+
+
+def iter_calibration_results(aircok_files, grimm_file, testo_file, wolfsense_file, reference,
+                             agg=RESAMPLE_AGG, workers=1, fit_workers=DEFAULT_FIT_WORKERS, xgb_profile=None):
+    # (aircok_file, result)를 끝난 순서대로 돌려준다. workers <= 1 이면 현재 프로세스에서 순서대로 처리.
+    # 프로세스 풀을 쓸 때는 코어가 이미 파일 단위로 나뉘므로 파일 안의 모델 학습은 순차로 둔다.
+    workers = max(1, min(int(workers or 1), len(aircok_files)))
+    if workers == 1:
+        for aircok_file in aircok_files:
+            yield aircok_file, calibrate_aircok_file(aircok_file, grimm_file, testo_file, wolfsense_file, reference, agg,
+                                                     fit_workers, xgb_profile)
+        return
+
+    # 프로필이 스레드 수를 정하지 않았으면 워커마다 xgboost 스레드 1개로 제한해 코어 과점유를 막는다.
+    xgb_profile = resolve_xgb_profile(xgb_profile)
+    if xgb_profile["n_jobs"] is None:
+        xgb_profile["n_jobs"] = 1
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(reference,))
+    try:
+        futures = {
+            executor.submit(_calibrate_in_worker, aircok_file, grimm_file, testo_file, wolfsense_file, agg,
+                            xgb_profile): aircok_file
+            for aircok_file in aircok_files
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,17 +1,28 @@
 import pandas as pd
 
-def co2_cal(co2_file_path, aircok_file_path):
-    co2_data = pd.read_excel(co2_file_path)
-    co2_data = co2_data[['Date Time', 'Carbon Dioxide ppm']]
-    co2_data.columns = ['date', 'co2']
-    co2_data['date'] = pd.to_datetime(co2_data['date'], format='%Y-%m-%d %p %I:%M:%S')
-    co2_data['date'] = co2_data['date'].dt.round('5min')
-    co2_data['co2'] = co2_data['co2'].clip(lower=400)
-
-    aircok_data = pd.read_csv(aircok_file_path)
-    aircok_data = aircok_data[['date', 'co2']].copy()
-    aircok_data['date'] = pd.to_datetime(aircok_data['date'])
+from src.calibration.resample import RESAMPLE_AGG, resample_5min
+from src.utils.table_io import read_table
+
+def prepare_wolfsense_data(path, agg=RESAMPLE_AGG):
+    df = pd.read_excel(path)
+    df = df[['Date Time', 'Carbon Dioxide ppm']]
+    df.columns = ['date', 'co2']
+    df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d %p %I:%M:%S')
+    df['co2'] = df['co2'].clip(lower=400)
+    return resample_5min(df, agg)
+
+def co2_cal(co2_file_path, aircok_file_path, co2_data=None, aircok=None, agg=RESAMPLE_AGG):
+    if co2_data is None:
+        co2_data = prepare_wolfsense_data(co2_file_path, agg)
+
+    if aircok is None:
+        aircok_data = read_table(aircok_file_path)
+        aircok_data = aircok_data[['date', 'co2']].copy()
+        aircok_data['date'] = pd.to_datetime(aircok_data['date'])
+    else:
+        aircok_data = aircok[['date', 'co2']].copy()
     aircok_data['co2'] = aircok_data['co2'].clip(lower=400)
+    aircok_data = resample_5min(aircok_data.dropna(), agg)
 
     merged = pd.merge(co2_data, aircok_data, on='date', how='inner').dropna()
 
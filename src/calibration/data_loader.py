@@ -0,0 +1,46 @@
+from functools import partial
+import pandas as pd
+
+from src.calibration.co2 import prepare_wolfsense_data
+from src.calibration.pm import prepare_grimm_data
+from src.calibration.resample import RESAMPLE_AGG
+from src.calibration.temp_humi import load_testo_data
+from src.utils.file_cache import cached_read
+from src.utils.table_io import read_table
+
+
+def load_reference_data(grimm_file=None, testo_file=None, wolfsense_file=None, agg=RESAMPLE_AGG):
+    # 기준 장비 파일은 보정 1회당 한 번만 읽고, 모든 Aircok 파일 보정에 같은 프레임을 공유한다.
+    # 보정 함수들은 이 프레임을 수정하지 않고 merge 결과만 새로 만든다.
+    return {
+        "grimm": load_grimm_file(grimm_file, agg) if grimm_file else None,
+        "testo": load_testo_file(testo_file, agg) if testo_file else None,
+        "wolfsense": load_wolfsense_file(wolfsense_file, agg) if wolfsense_file else None,
+    }
+
+
+def load_grimm_file(path, agg=RESAMPLE_AGG):
+    return cached_read(path, partial(prepare_grimm_data, agg=agg), f"grimm-{agg}")
+
+
+def load_testo_file(path, agg=RESAMPLE_AGG):
+    return cached_read(path, partial(load_testo_data, agg=agg), f"testo-{agg}")
+
+
+def load_wolfsense_file(path, agg=RESAMPLE_AGG):
+    return cached_read(path, partial(prepare_wolfsense_data, agg=agg), f"wolfsense-{agg}")
+
+
+def load_aircok_file(path):
+    return cached_read(path, read_aircok_file, "aircok")
+
+
+def read_aircok_file(path):
+    # Aircok CSV는 파일당 한 번만 읽고 date도 한 번만 변환한 뒤 pm/온습도/co2 보정에 같이 넘긴다.
+    # 센서 컬럼은 float32로 맞춰 메모리를 줄이고, 결측 제거는 각 보정 함수가 자기 컬럼 기준으로 한다.
+    # Parquet / Feather 는 이미 datetime64 / float32 이므로 아래 변환은 그대로 통과한다.
+    df = read_table(path)
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    sensor_cols = [col for col in df.columns if col != 'date']
+    df[sensor_cols] = df[sensor_cols].apply(pd.to_numeric, errors='coerce').astype('float32')
+    return df.dropna(subset=['date'])
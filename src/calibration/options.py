@@ -0,0 +1,24 @@
+import os
+
+# 무거운 라이브러리(xgboost, sklearn)를 불러오지 않고도 GUI가 참조할 수 있는 보정 기본 설정
+
+# 여러 파일 동시 보정은 설정 메뉴에서 켠다 (작업 프로세스마다 xgboost/sklearn 등을 다시 불러오므로 기본은 순차)
+DEFAULT_CALIBRATION_WORKERS = 1
+# 파일 하나를 보정할 때 PM 구간별 모델을 동시에 학습할 스레드 수 (학습 작업은 최대 2종 x 4구간)
+MAX_FIT_JOBS = 2 * 4
+DEFAULT_FIT_WORKERS = min(MAX_FIT_JOBS, os.cpu_count() or 1)
+
+# XGBoost 학습 프로필. None 값은 xgboost 기본값을 그대로 쓴다.
+# - default: 기존과 동일한 설정 (정확도 우선)
+# - fast: 스레드 1개 + hist + 얕은 트리 + 검증 세트 조기 종료 (대량 보정/병렬 보정용)
+XGB_PROFILES = {
+    "default": {
+        "n_jobs": None, "tree_method": None, "n_estimators": None, "max_depth": None,
+        "early_stopping_rounds": None, "validation_fraction": 0.0,
+    },
+    "fast": {
+        "n_jobs": 1, "tree_method": "hist", "n_estimators": 200, "max_depth": 4,
+        "early_stopping_rounds": 10, "validation_fraction": 0.2,
+    },
+}
+DEFAULT_XGB_PROFILE = "default"
@@ -1,28 +1,46 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import numpy as np
 import pandas as pd
 import xgboost as xgb
 
+from src.calibration.options import XGB_PROFILES, DEFAULT_XGB_PROFILE
+from src.calibration.resample import RESAMPLE_AGG, resample_5min
+from src.utils.table_io import read_table
+
 try:
     from sklearn.neural_network import MLPRegressor
     HAS_SKLEARN = True
 except Exception:
     HAS_SKLEARN = False
 
-def prepare_grimm_data(path):
+# 조기 종료용 검증 세트를 떼어낼 최소 샘플 수 (이보다 작으면 전체로 학습)
+EARLY_STOPPING_MIN_SAMPLES = 20
+
+def resolve_xgb_profile(profile=None):
+    if profile is None:
+        profile = DEFAULT_XGB_PROFILE
+    if isinstance(profile, str):
+        if profile not in XGB_PROFILES:
+            raise ValueError(f"알 수 없는 XGBoost 프로필입니다: {profile}")
+        return dict(XGB_PROFILES[profile])
+    return {**XGB_PROFILES[DEFAULT_XGB_PROFILE], **profile}
+
+def prepare_grimm_data(path, agg=RESAMPLE_AGG):
     df = pd.read_csv(path, encoding='ISO-8859-1', skiprows=12, sep='\t', header=None)
     df.columns = ['datetime', 'pm10', 'pm2.5', 'pm1', 'inhalable', 'thoracic', 'alveolic']
     df = df[['datetime', 'pm10', 'pm2.5']].rename(
         columns={'datetime': 'date', 'pm10': 'grimm_pm10', 'pm2.5': 'grimm_pm25'}
     )
     df['date'] = df['date'].str.replace('¿ÀÀü', 'AM', regex=False).str.replace('¿ÀÈÄ', 'PM', regex=False)
-    df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d %p %I:%M:%S', errors='coerce').dt.round('5min')
+    df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d %p %I:%M:%S', errors='coerce')
     df['grimm_pm25'] = pd.to_numeric(df['grimm_pm25'], errors='coerce')
     df['grimm_pm10'] = pd.to_numeric(df['grimm_pm10'], errors='coerce')
-    return df.dropna()
+    return resample_5min(df.dropna(), agg)
 
 def prepare_aircok_data(path):
-    df = pd.read_csv(path, usecols=['date', 'pm2.5', 'pm10'])
+    df = read_table(path, columns=['date', 'pm2.5', 'pm10'])
     df['date'] = pd.to_datetime(df['date'], errors='coerce')
     df['pm2.5'] = pd.to_numeric(df['pm2.5'], errors='coerce')
     df['pm10']  = pd.to_numeric(df['pm10'],  errors='coerce')
@@ -35,24 +53,27 @@ def calc_accuracy(true, pred, eps=1e-9):
 def safe_ratio(num, den, eps=1e-9):
     return num / np.where(den == 0, eps, den)
 
-def method_scalar(sensor, grimm):
-    y_ratio = safe_ratio(grimm, sensor)
-    y_ratio = y_ratio[np.isfinite(y_ratio) & (y_ratio > 0)]
-    if y_ratio.size < 3:
-        return None
-    factor = round(float(np.median(y_ratio)), 2)
-    corrected = sensor * factor
-    return {"name": "scalar", "factor": factor, "corrected": corrected}
-
-def method_xgb(X, sensor, grimm):
+def method_xgb(X, sensor, grimm, profile=None):
     y_ratio = safe_ratio(grimm, sensor)
     mask = np.isfinite(y_ratio) & (y_ratio > 0)
     X_ = X[mask]
     y_ = y_ratio[mask]
     if len(X_) < 3:
         return None
-    model = xgb.XGBRegressor(objective='reg:squarederror', verbosity=0)
-    model.fit(X_, y_)
+    params = resolve_xgb_profile(profile)
+    model_params = {key: params[key] for key in ("n_jobs", "tree_method", "n_estimators", "max_depth")
+                    if params[key] is not None}
+    rounds = params["early_stopping_rounds"]
+    n_valid = int(len(X_) * params["validation_fraction"])
+    if rounds and n_valid > 0 and len(X_) >= EARLY_STOPPING_MIN_SAMPLES:
+        order = np.random.default_rng(42).permutation(len(X_))
+        train, valid = order[n_valid:], order[:n_valid]
+        model = xgb.XGBRegressor(objective='reg:squarederror', verbosity=0,
+                                 early_stopping_rounds=rounds, **model_params)
+        model.fit(X_.iloc[train], y_.iloc[train], eval_set=[(X_.iloc[valid], y_.iloc[valid])], verbose=False)
+    else:
+        model = xgb.XGBRegressor(objective='reg:squarederror', verbosity=0, **model_params)
+        model.fit(X_, y_)
     pred_ratio = model.predict(X_)
     if pred_ratio.size == 0:
         return None
@@ -82,97 +103,137 @@ def method_mlp(X, sensor, grimm):
     corrected_full.loc[mask] = corrected
     return {"name": "mlp", "factor": factor, "corrected": corrected_full}
 
-def pm_cal(grimm_file_path, aircok_file_path):
-    grimm = prepare_grimm_data(grimm_file_path)
-    aircok = prepare_aircok_data(aircok_file_path)
-    merged = pd.merge(grimm, aircok, on='date', how='inner').dropna().copy()
-    bins   = [10, 30, 60, 100, 200]
-    labels = ['10-30', '31-60', '61-100', '101-200']
-    merged['pm25_range'] = pd.cut(merged['pm2.5'], bins=bins, labels=labels, right=True, include_lowest=True)
-    merged['pm10_range'] = pd.cut(merged['pm10'],  bins=bins, labels=labels, right=True, include_lowest=True)
-    correction_factors_pm25, correction_factors_pm10 = [], []
-    methods_pm25, methods_pm10 = [], []
-    merged['corrected_pm25'] = np.nan
-    merged['corrected_pm10'] = np.nan
-
-    for label in labels:
-        idx25 = merged.index[merged['pm25_range'] == label]
-        if len(idx25) > 0:
-            sub = merged.loc[idx25]
-            X_25 = sub[['pm2.5', 'pm10']]
-            sensor_25 = sub['pm2.5']
-            true_25   = sub['grimm_pm25']
-            m_scalar = method_scalar(sensor_25, true_25)
-            m_xgb    = method_xgb(X_25, sensor_25, true_25)
-            m_mlp    = method_mlp(X_25, sensor_25, true_25)
-            print(f"\n[PM2.5] 구간: {label} (샘플 {len(sub)})")
-            candidates_25 = []
-            for m in [m_scalar, m_xgb, m_mlp]:
-                if m is None:
-                    continue
-                name   = m['name']
-                factor = m['factor']
-                acc    = calc_accuracy(true_25, m['corrected'].fillna(0) if isinstance(m['corrected'], pd.Series) else m['corrected'])
-                candidates_25.append((name, factor, acc, m['corrected']))
-                c_min = np.nanmin(m['corrected']) if isinstance(m['corrected'], (pd.Series, np.ndarray)) else float(np.min(m['corrected']))
-                c_max = np.nanmax(m['corrected']) if isinstance(m['corrected'], (pd.Series, np.ndarray)) else float(np.max(m['corrected']))
-                print(f" - {name:<6} | factor={factor:.2f} | acc={acc:.2f}% | min={c_min:.2f} max={c_max:.2f}")
-            if candidates_25:
-                best_name, best_factor, best_acc, best_corr = max(candidates_25, key=lambda x: x[2])
-                print(f" >> 선택됨: {best_name} (factor={best_factor}, acc={best_acc:.2f}%)")
-                correction_factors_pm25.append((label, best_factor))
-                methods_pm25.append((label, best_name, round(best_acc, 2)))
-                best_corr_vals = best_corr.values if isinstance(best_corr, pd.Series) else best_corr
-                merged.loc[idx25, 'corrected_pm25'] = best_corr_vals
-            else:
+PM_BINS   = [10, 30, 60, 100, 200]
+PM_LABELS = ['10-30', '31-60', '61-100', '101-200']
+
+def fit_candidates(jobs, fit_workers=1, xgb_profile=None):
+    """
+    jobs: {key: (X, sensor, true)} → {key: [xgb, mlp]}
+    구간/방법별 학습은 서로 독립이므로 fit_workers > 1 이면 스레드 풀에서 동시에 돌린다.
+    (xgboost/sklearn 학습은 GIL을 놓기 때문에 스레드로도 병렬 효과가 있음)
+    프로필이 xgboost 스레드 수를 정하지 않았으면 코어를 동시 학습 수로 나눠 과점유를 막는다.
+    """
+    if fit_workers <= 1 or len(jobs) == 0:
+        return {key: [method_xgb(X, sensor, true, xgb_profile), method_mlp(X, sensor, true)]
+                for key, (X, sensor, true) in jobs.items()}
+
+    fit_workers = min(fit_workers, 2 * len(jobs))
+    xgb_profile = resolve_xgb_profile(xgb_profile)
+    if xgb_profile["n_jobs"] is None:
+        xgb_profile["n_jobs"] = max(1, (os.cpu_count() or 1) // fit_workers)
+
+    with ThreadPoolExecutor(max_workers=fit_workers) as executor:
+        futures = {
+            key: [executor.submit(method_xgb, X, sensor, true, xgb_profile),
+                  executor.submit(method_mlp, X, sensor, true)]
+            for key, (X, sensor, true) in jobs.items()
+        }
+        return {key: [f.result() for f in fs] for key, fs in futures.items()}
+
+def assign_bins(values, bins=PM_BINS):
+    """
+    구간 번호(0..len(bins)-2)를 한 번에 계산하고 구간별 행 위치를 돌려준다. 구간 밖은 -1.
+    한 번 정렬한 뒤 경계만 searchsorted로 찾으므로 구간마다 전체를 다시 훑지 않는다.
+    """
+    codes = pd.cut(values, bins=bins, labels=False, right=True, include_lowest=True)
+    codes = np.nan_to_num(np.asarray(codes, dtype=float), nan=-1).astype(np.int64)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(bins)))
+    positions = [order[bounds[i]:bounds[i + 1]] for i in range(len(bins) - 1)]
+    return codes, positions
+
+def scalar_factors(sensor, true, codes, n_bins):
+    """
+    scalar 방법의 구간별 계수를 한 번에 계산한다: 기준/센서 비율 중 유효한 값(유한, 양수)이 3개 이상이면
+    그 중앙값을 소수 둘째 자리로 반올림, 아니면 None.
+    """
+    ratio = safe_ratio(true, sensor)
+    valid = np.isfinite(ratio) & (ratio > 0) & (codes >= 0)
+    grouped = pd.Series(ratio[valid]).groupby(codes[valid])
+    stats = pd.DataFrame({"median": grouped.median(), "count": grouped.size()}).reindex(range(n_bins))
+    return [round(float(m), 2) if c >= 3 else None for m, c in zip(stats["median"], stats["count"])]
+
+def binned_calibration(df, targets, features, bins=PM_BINS, labels=PM_LABELS, fit_workers=1, xgb_profile=None):
+    """
+    targets: [(name, sensor_col, true_col, title)] → {name: {"factors", "methods", "corrected"}}
+    대상 컬럼마다 농도 구간을 나누고, 구간별로 scalar/xgb/mlp 중 정확도가 가장 높은 방법을 고른다.
+    """
+    X = df[features]
+    binned, jobs = {}, {}
+    for name, sensor_col, true_col, _ in targets:
+        sensor = df[sensor_col].to_numpy(dtype=float)
+        true = df[true_col].to_numpy(dtype=float)
+        codes, positions = assign_bins(sensor, bins)
+        binned[name] = (sensor, true, positions, scalar_factors(sensor, true, codes, len(labels)))
+        for i, pos in enumerate(positions):
+            if len(pos) > 0:
+                jobs[(name, i)] = (X.iloc[pos], df[sensor_col].iloc[pos], df[true_col].iloc[pos])
+    fitted = fit_candidates(jobs, fit_workers, xgb_profile)
+
+    results = {name: {"factors": [], "methods": [], "corrected": np.full(len(df), np.nan)}
+               for name, _, _, _ in targets}
+    for i, label in enumerate(labels):
+        for name, _, _, title in targets:
+            sensor, true, positions, scalars = binned[name]
+            out = results[name]
+            pos = positions[i]
+            print(f"\n[{title}] 구간: {label} (샘플 {len(pos)})")
+            if len(pos) == 0:
                 print(f" >> 선택됨: default (factor=1.00, acc=0.00%)")
-                correction_factors_pm25.append((label, 1.0))
-                methods_pm25.append((label, "default", 0.0))
-                merged.loc[idx25, 'corrected_pm25'] = sensor_25.values
-        else:
-            print(f"\n[PM2.5] 구간: {label} (샘플 0)")
-            print(f" >> 선택됨: default (factor=1.00, acc=0.00%)")
-            correction_factors_pm25.append((label, 1.0))
-            methods_pm25.append((label, "default", 0.0))
-
-        idx10 = merged.index[merged['pm10_range'] == label]
-        if len(idx10) > 0:
-            sub = merged.loc[idx10]
-            X_10 = sub[['pm2.5', 'pm10']]
-            sensor_10 = sub['pm10']
-            true_10   = sub['grimm_pm10']
-            m_scalar = method_scalar(sensor_10, true_10)
-            m_xgb    = method_xgb(X_10, sensor_10, true_10)
-            m_mlp    = method_mlp(X_10, sensor_10, true_10)
-            print(f"\n[PM10 ] 구간: {label} (샘플 {len(sub)})")
-            candidates_10 = []
-            for m in [m_scalar, m_xgb, m_mlp]:
+                out["factors"].append((label, 1.0))
+                out["methods"].append((label, "default", 0.0))
+                continue
+
+            sensor_sub, true_sub = sensor[pos], true[pos]
+            m_scalar = None
+            if scalars[i] is not None:
+                m_scalar = {"name": "scalar", "factor": scalars[i], "corrected": sensor_sub * scalars[i]}
+            candidates = []
+            for m in [m_scalar] + fitted[(name, i)]:
                 if m is None:
                     continue
-                name   = m['name']
-                factor = m['factor']
-                acc    = calc_accuracy(true_10, m['corrected'].fillna(0) if isinstance(m['corrected'], pd.Series) else m['corrected'])
-                candidates_10.append((name, factor, acc, m['corrected']))
-                c_min = np.nanmin(m['corrected']) if isinstance(m['corrected'], (pd.Series, np.ndarray)) else float(np.min(m['corrected']))
-                c_max = np.nanmax(m['corrected']) if isinstance(m['corrected'], (pd.Series, np.ndarray)) else float(np.max(m['corrected']))
-                print(f" - {name:<6} | factor={factor:.2f} | acc={acc:.2f}% | min={c_min:.2f} max={c_max:.2f}")
-            if candidates_10:
-                best_name, best_factor, best_acc, best_corr = max(candidates_10, key=lambda x: x[2])
+                corrected = m['corrected']
+                corrected = corrected.to_numpy() if isinstance(corrected, pd.Series) else np.asarray(corrected)
+                acc = calc_accuracy(true_sub, np.nan_to_num(corrected, nan=0.0))
+                candidates.append((m['name'], m['factor'], acc, corrected))
+                print(f" - {m['name']:<6} | factor={m['factor']:.2f} | acc={acc:.2f}% "
+                      f"| min={np.nanmin(corrected):.2f} max={np.nanmax(corrected):.2f}")
+
+            if candidates:
+                best_name, best_factor, best_acc, best_corr = max(candidates, key=lambda x: x[2])
                 print(f" >> 선택됨: {best_name} (factor={best_factor}, acc={best_acc:.2f}%)")
-                correction_factors_pm10.append((label, best_factor))
-                methods_pm10.append((label, best_name, round(best_acc, 2)))
-                best_corr_vals = best_corr.values if isinstance(best_corr, pd.Series) else best_corr
-                merged.loc[idx10, 'corrected_pm10'] = best_corr_vals
+                out["factors"].append((label, best_factor))
+                out["methods"].append((label, best_name, round(best_acc, 2)))
+                out["corrected"][pos] = best_corr
             else:
                 print(f" >> 선택됨: default (factor=1.00, acc=0.00%)")
-                correction_factors_pm10.append((label, 1.0))
-                methods_pm10.append((label, "default", 0.0))
-                merged.loc[idx10, 'corrected_pm10'] = sensor_10.values
-        else:
-            print(f"\n[PM10 ] 구간: {label} (샘플 0)")
-            print(f" >> 선택됨: default (factor=1.00, acc=0.00%)")
-            correction_factors_pm10.append((label, 1.0))
-            methods_pm10.append((label, "default", 0.0))
+                out["factors"].append((label, 1.0))
+                out["methods"].append((label, "default", 0.0))
+                out["corrected"][pos] = sensor_sub
+    return results
+
+def pm_cal(grimm_file_path, aircok_file_path, grimm=None, aircok=None, agg=RESAMPLE_AGG, fit_workers=1,
+           xgb_profile=None):
+    if grimm is None:
+        grimm = prepare_grimm_data(grimm_file_path, agg)
+    if aircok is None:
+        aircok = prepare_aircok_data(aircok_file_path)
+    else:
+        aircok = aircok[['date', 'pm2.5', 'pm10']].dropna()
+    aircok = resample_5min(aircok, agg)
+    merged = pd.merge(grimm, aircok, on='date', how='inner').dropna().reset_index(drop=True)
+
+    binned = binned_calibration(
+        merged,
+        targets=[('pm25', 'pm2.5', 'grimm_pm25', 'PM2.5'), ('pm10', 'pm10', 'grimm_pm10', 'PM10 ')],
+        features=['pm2.5', 'pm10'],
+        fit_workers=fit_workers,
+        xgb_profile=xgb_profile,
+    )
+    correction_factors_pm25, methods_pm25 = binned['pm25']['factors'], binned['pm25']['methods']
+    correction_factors_pm10, methods_pm10 = binned['pm10']['factors'], binned['pm10']['methods']
+    merged['corrected_pm25'] = binned['pm25']['corrected']
+    merged['corrected_pm10'] = binned['pm10']['corrected']
 
     merged = merged.dropna(subset=['corrected_pm25', 'corrected_pm10'])
 
@@ -0,0 +1,13 @@
+RESAMPLE_FREQ = '5min'
+RESAMPLE_AGG = 'mean'
+RESAMPLE_AGGS = ('mean', 'median')
+
+
+def resample_5min(df, agg=RESAMPLE_AGG, freq=RESAMPLE_FREQ):
+    # 시각을 5분 단위로 반올림한 구간마다 한 행만 남긴다(mean/median).
+    # 고빈도 기준 장비 로그를 그대로 merge 하면 같은 키가 여러 번 나와 many-to-many 가 되므로 join 전에 줄인다.
+    if agg not in RESAMPLE_AGGS:
+        raise ValueError(f"지원하지 않는 집계 방식입니다: {agg}")
+    key = df['date'].dt.round(freq)
+    out = df.drop(columns='date').groupby(key).agg(agg)
+    return out.reset_index()
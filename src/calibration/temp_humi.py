@@ -1,15 +1,17 @@
 import pandas as pd
 
-def load_testo_data(path):
+from src.calibration.resample import RESAMPLE_AGG, resample_5min
+from src.utils.table_io import read_table
+
+def load_testo_data(path, agg=RESAMPLE_AGG):
     df = pd.read_csv(path, sep=";")[['날짜', '습도[%RH]', '온도[°C]']]
     df.columns = ['date', 'humidity', 'temperature']
     df['date'] = df['date'].str.replace('오전', 'AM', regex=False).str.replace('오후', 'PM', regex=False)
     df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d %p %I:%M:%S', errors='coerce')
-    df['date'] = df['date'].dt.round('5min')
-    return df.dropna()
+    return resample_5min(df.dropna(), agg)
 
 def load_aircok_data(path):
-    df = pd.read_csv(path, usecols=['date', 'temp', 'humi'])
+    df = read_table(path, columns=['date', 'temp', 'humi'])
     df['date'] = pd.to_datetime(df['date'], errors='coerce')
     return df.dropna()
 
@@ -27,9 +29,14 @@ def calculate_correction(true_avg, raw_avg, values, tolerance=0.01):
         correction_str = f"{'+' if correction >= 0 else ''}{round(correction * 10, 1)}"
     return corrected, correction_str, round(corrected_accuracy, 2)
 
-def temp_humi_cal(testo_file_path, aircok_file_path):
-    testo = load_testo_data(testo_file_path)
-    aircok = load_aircok_data(aircok_file_path)
+def temp_humi_cal(testo_file_path, aircok_file_path, testo=None, aircok=None, agg=RESAMPLE_AGG):
+    if testo is None:
+        testo = load_testo_data(testo_file_path, agg)
+    if aircok is None:
+        aircok = load_aircok_data(aircok_file_path)
+    else:
+        aircok = aircok[['date', 'temp', 'humi']].dropna()
+    aircok = resample_5min(aircok, agg)
     merged = pd.merge(testo, aircok, on='date', how='inner').dropna()
 
     t_temp, a_temp = merged['temperature'].mean(), merged['temp'].mean()
@@ -48,25 +48,34 @@
 # 미세먼지 보정 오류 수정
 # 데이터 다운로더 DB  수정
 
+import time
+_START_TIME = time.perf_counter()
+
+import importlib
 import os
 import sys
+from multiprocessing import freeze_support
 from PyQt5 import uic
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QFileDialog, QMessageBox, QDialog,
-    QProgressDialog
+    QProgressDialog, QInputDialog, QMenu, QActionGroup
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+
+# xgboost/sklearn, sqlalchemy, pyqtgraph 등 무거운 모듈은 창을 띄운 뒤 처음 사용할 때 불러온다.
+from src.calibration.options import DEFAULT_CALIBRATION_WORKERS, DEFAULT_XGB_PROFILE
+from src.calibration.resample import RESAMPLE_AGG
 
-from src.calibration.co2 import co2_cal
-from src.calibration.pm import pm_cal
-from src.calibration.temp_humi import temp_humi_cal
-from src.report.aircok_report import ReportGeneratorThread
-from modules.parsing.lcd_parsing import LogConverterApp
-from modules.downloader.data_downloader import DataDownloader
-from src.report.calibration_report import generate_calibration_report as export_calibration_report
-from src.calibration.cumulative_calibration import load_previous_calibration, apply_calibration_merge
-from utils.compare_graph import GraphCompareDialog
+# 창이 뜬 뒤 백그라운드에서 미리 불러 둘 모듈 (Qt 위젯을 만드는 모듈은 제외)
+WARMUP_ENABLED = True
+WARMUP_MODULES = [
+    "src.calibration.batch",
+    "src.calibration.cumulative_calibration",
+    "src.report.aircok_report",
+    "src.report.calibration_report",
+    "sqlalchemy",
+]
 
 
 def resource_path(relative_path):
@@ -75,31 +84,50 @@ def resource_path(relative_path):
     base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
+class WarmupThread(QThread):
+    def __init__(self, module_names):
+        super().__init__()
+        self.module_names = module_names
+
+    def run(self):
+        for name in self.module_names:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"모듈 미리 불러오기 실패: {name} ({e})")
+
 class CalibrationThread(QThread):
     progress = pyqtSignal(str)
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, aircok_files, grimm_file, testo_file, wolfsense_file):
+    def __init__(self, aircok_files, grimm_file, testo_file, wolfsense_file, resample_agg=RESAMPLE_AGG, workers=1,
+                 xgb_profile=DEFAULT_XGB_PROFILE):
         super().__init__()
         self.aircok_files = aircok_files
         self.grimm_file = grimm_file
         self.testo_file = testo_file
         self.wolfsense_file = wolfsense_file
+        self.resample_agg = resample_agg
+        self.workers = workers
+        self.xgb_profile = xgb_profile
 
     def run(self):
         try:
+            from src.calibration.data_loader import load_reference_data
+            from src.calibration.batch import iter_calibration_results
+
             results = {}
-            for aircok_file in self.aircok_files:
-                file_result = {}
-                if self.grimm_file:
-                    file_result.update(pm_cal(self.grimm_file, aircok_file))
-                if self.testo_file:
-                    file_result.update(temp_humi_cal(self.testo_file, aircok_file))
-                if self.wolfsense_file:
-                    file_result.update(co2_cal(self.wolfsense_file, aircok_file))
+            agg = self.resample_agg
+            reference = load_reference_data(self.grimm_file, self.testo_file, self.wolfsense_file, agg)
+            self.progress.emit("기준 데이터 로드 완료")
+            for aircok_file, file_result in iter_calibration_results(
+                self.aircok_files, self.grimm_file, self.testo_file, self.wolfsense_file,
+                reference, agg, self.workers, xgb_profile=self.xgb_profile
+            ):
                 results[aircok_file] = file_result
                 self.progress.emit(f"{aircok_file} 보정 완료")
+            results = {aircok_file: results[aircok_file] for aircok_file in self.aircok_files}
             self.finished.emit(results)
         except Exception as e:
             self.error.emit(str(e))
@@ -118,6 +146,11 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
         self.aircok_files = []
         self.current_file_index = 0
         self.aircok_report = {}
+        self.calibration_workers = DEFAULT_CALIBRATION_WORKERS
+        self.xgb_profile = DEFAULT_XGB_PROFILE
+        self.report_low_memory = False
+        self.report_incremental = False
+        self.report_resample = None
 
         self.grimm_button.clicked.connect(self.grimm_button_clicked)
         self.testo_button.clicked.connect(self.testo_button_clicked)
@@ -144,6 +177,51 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
         self.data_downloader_window = None
         self.aircok_data_downloader.triggered.connect(self.open_data_downloader)
 
+        self.menu_settings = QMenu("설정", self)
+        self.menubar.insertMenu(self.menuHelp.menuAction(), self.menu_settings)
+        self.menu_settings.addAction("보정 병렬 작업 수", self.set_calibration_workers)
+        menu_profile = self.menu_settings.addMenu("PM 보정 학습 방식")
+        profile_group = QActionGroup(self)
+        for profile, text in [("default", "정밀 (기본값)"), ("fast", "고속 (대량 보정)")]:
+            action = menu_profile.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(profile == self.xgb_profile)
+            action.triggered.connect(lambda _, p=profile, t=text: self.set_xgb_profile(p, t))
+            profile_group.addAction(action)
+        action_low_memory = self.menu_settings.addAction("보고서 저메모리 모드")
+        action_low_memory.setCheckable(True)
+        action_low_memory.toggled.connect(self.set_report_low_memory)
+        action_incremental = self.menu_settings.addAction("보고서 이어서 갱신 (바뀐 파일만 반영)")
+        action_incremental.setCheckable(True)
+        action_incremental.toggled.connect(self.set_report_incremental)
+        menu_resample = self.menu_settings.addMenu("보고서 시간 집계")
+        resample_group = QActionGroup(self)
+        for freq, text in [(None, "원본 간격 (기본값)"), ("1h", "1시간 (평균/최소/최대/개수)"), ("1D", "1일 (평균/최소/최대/개수)")]:
+            action = menu_resample.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(freq == self.report_resample)
+            action.triggered.connect(lambda _, f=freq, t=text: self.set_report_resample(f, t))
+            resample_group.addAction(action)
+        self.menu_settings.addSeparator()
+        self.menu_settings.addAction("파일 캐시 비우기", self.clear_file_cache)
+
+        self.warmup_thread = None
+
+    def start_warmup(self):
+        if not WARMUP_ENABLED or self.warmup_thread:
+            return
+        self.warmup_thread = WarmupThread(WARMUP_MODULES)
+        # import 는 중간에 멈출 수 없으므로, 실행 중인 QThread 가 파괴되지 않도록 종료 전에 끝나기를 기다린다
+        QApplication.instance().aboutToQuit.connect(self.wait_warmup)
+        self.warmup_thread.start()
+
+    def wait_warmup(self):
+        if self.warmup_thread:
+            self.warmup_thread.wait()
+
+    def report_startup_time(self, elapsed):
+        self.consol.append(f"프로그램 시작 시간: {elapsed:.2f}초")
+
     def short_path(self, full_path, depth=2):
         parts = full_path.replace("\\", "/").split("/")
         return "/".join(parts[-depth:])
@@ -160,6 +238,7 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
 
     def open_log_converter(self):
         if not self.log_converter_window:
+            from src.modules.parsing.lcd_parsing import LogConverterApp
             self.log_converter_window = LogConverterApp()
             self.log_converter_window.finished.connect(self.cleanup_log_converter)
         self.log_converter_window.show()
@@ -169,6 +248,7 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
 
     def open_data_downloader(self):
         if not self.data_downloader_window:
+            from modules.downloader.data_downloader import DataDownloader
             self.data_downloader_window = DataDownloader()
             self.data_downloader_window.setWindowTitle("Aircok Data Extractor v1.1.2")
             self.data_downloader_window.setAttribute(Qt.WA_DeleteOnClose)
@@ -178,6 +258,36 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
     def cleanup_data_downloader(self):
         self.data_downloader_window = None
 
+    def set_calibration_workers(self):
+        workers, ok = QInputDialog.getInt(
+            self, "보정 병렬 작업 수", "동시에 보정할 Aircok 파일 수 (1 = 순차 처리):",
+            self.calibration_workers, 1, os.cpu_count() or 1
+        )
+        if ok:
+            self.calibration_workers = workers
+            self.consol.append(f"보정 병렬 작업 수: {workers}")
+
+    def set_xgb_profile(self, profile, text):
+        self.xgb_profile = profile
+        self.consol.append(f"PM 보정 학습 방식: {text}")
+
+    def set_report_low_memory(self, enabled):
+        self.report_low_memory = enabled
+        self.consol.append(f"보고서 저메모리 모드: {'켜짐' if enabled else '꺼짐'}")
+
+    def set_report_incremental(self, enabled):
+        self.report_incremental = enabled
+        self.consol.append(f"보고서 이어서 갱신: {'켜짐' if enabled else '꺼짐'}")
+
+    def set_report_resample(self, freq, text):
+        self.report_resample = freq
+        self.consol.append(f"보고서 시간 집계: {text}")
+
+    def clear_file_cache(self):
+        from src.utils.file_cache import clear_cache
+        removed = clear_cache()
+        self.consol.append(f"파일 캐시 비움: {removed}개 삭제")
+
     def grimm_button_clicked(self):
         self.grimm_file, _ = QFileDialog.getOpenFileName(self, "Grimm 파일 열기", "", "Grimm 파일 (*.dat)")
         if self.grimm_file:
@@ -194,9 +304,13 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
             self.consol.append(f"Wolfsense 파일 로드 완료: {self.short_path(self.wolfsense_file)}")
 
     def aircok_button_clicked(self):
-        self.aircok_files, _ = QFileDialog.getOpenFileNames(self, "Aircok 데이터 파일 열기", "", "Aircok 파일 (*.csv)")
+        self.aircok_files, _ = QFileDialog.getOpenFileNames(self, "Aircok 데이터 파일 열기", "",
+                                                           "Aircok 파일 (*.csv *.parquet *.feather *.txt)")
         if self.aircok_files:
             self.consol.append(f"Aircok 파일 {len(self.aircok_files)}개 로드 완료")
+            lcd_logs = sum(file.lower().endswith(".txt") for file in self.aircok_files)
+            if lcd_logs:
+                self.consol.append(f"LCD 로그 {lcd_logs}개는 CSV 변환 없이 바로 읽습니다")
             self.current_file_index = 0
 
     def calibration_button_clicked(self):
@@ -213,7 +327,8 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
         self.progress_dialog.show()
 
         self.calibration_thread = CalibrationThread(
-            self.aircok_files, self.grimm_file, self.testo_file, self.wolfsense_file
+            self.aircok_files, self.grimm_file, self.testo_file, self.wolfsense_file,
+            workers=self.calibration_workers, xgb_profile=self.xgb_profile
         )
         self.calibration_thread.progress.connect(lambda msg: self.consol.append(msg))
         self.calibration_thread.finished.connect(self._calibration_done)
@@ -309,6 +424,7 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
             output_file += ".xlsx"
 
         try:
+            from src.report.calibration_report import generate_calibration_report as export_calibration_report
             export_calibration_report(self.aircok_report, output_file)
             QMessageBox.information(self, "완료", f"보정 보고서가 저장되었습니다:\n{output_file}")
         except Exception as e:
@@ -319,13 +435,15 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
             QMessageBox.warning(self, "파일 없음", "먼저 Aircok 파일을 선택해주세요.")
             return
 
-        output_file, _ = QFileDialog.getSaveFileName(
-            self, "보고서 저장", "aircok_report.xlsx", "Excel 파일 (*.xlsx)"
+        from src.report.report_writer import REPORT_FORMATS
+        output_file, selected_filter = QFileDialog.getSaveFileName(
+            self, "보고서 저장", "aircok_report.xlsx", ";;".join(REPORT_FORMATS)
         )
         if not output_file:
             return
-        if not output_file.endswith(".xlsx"):
-            output_file += ".xlsx"
+        extension, writer_mode = REPORT_FORMATS.get(selected_filter, REPORT_FORMATS["Excel 파일 (*.xlsx)"])
+        if not output_file.endswith(extension):
+            output_file += extension
 
         self.progress_dialog = QProgressDialog("보고서를 생성 중입니다...", None, 0, 100, self)
         self.progress_dialog.setWindowTitle("진행 중")
@@ -337,7 +455,11 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
 
         self.progress_dialog.show()
 
-        self.thread = ReportGeneratorThread(self.aircok_files, output_file)
+        from src.report.aircok_report import ReportGeneratorThread
+        self.thread = ReportGeneratorThread(self.aircok_files, output_file, writer_mode,
+                                            low_memory=self.report_low_memory,
+                                            incremental=self.report_incremental,
+                                            resample=self.report_resample)
         self.thread.progress.connect(self._update_report_progress)
         self.thread.finished.connect(self._report_generation_finished)
         self.thread.finished.connect(self.thread.deleteLater)
@@ -364,13 +486,15 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
             QMessageBox.warning(self, "파일 없음", "먼저 Aircok 파일을 선택해주세요.")
             return
 
-        output_file, _ = QFileDialog.getSaveFileName(
-            self, "보고서 저장", "aircok_report.xlsx", "Excel 파일 (*.xlsx)"
+        from src.report.report_writer import REPORT_FORMATS
+        output_file, selected_filter = QFileDialog.getSaveFileName(
+            self, "보고서 저장", "aircok_report.xlsx", ";;".join(REPORT_FORMATS)
         )
         if not output_file:
             return
-        if not output_file.endswith(".xlsx"):
-            output_file += ".xlsx"
+        extension, writer_mode = REPORT_FORMATS.get(selected_filter, REPORT_FORMATS["Excel 파일 (*.xlsx)"])
+        if not output_file.endswith(extension):
+            output_file += extension
 
         self.progress_dialog = QProgressDialog("보고서를 생성 중입니다...", None, 0, 100, self)
         self.progress_dialog.setWindowTitle("진행 중")
@@ -382,7 +506,11 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
 
         self.progress_dialog.show()
 
-        self.thread = ReportGeneratorThread(self.aircok_files, output_file)
+        from src.report.aircok_report import ReportGeneratorThread
+        self.thread = ReportGeneratorThread(self.aircok_files, output_file, writer_mode,
+                                            low_memory=self.report_low_memory,
+                                            incremental=self.report_incremental,
+                                            resample=self.report_resample)
         self.thread.progress.connect(self._update_report_progress)
         self.thread.finished.connect(self._report_generation_finished)
         self.thread.finished.connect(self.thread.deleteLater)
@@ -414,6 +542,7 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
             return
 
         try:
+            from src.calibration.cumulative_calibration import load_previous_calibration, apply_calibration_merge
             prev_data = load_previous_calibration(prev_file)
             apply_calibration_merge(self.aircok_report, prev_data)
         except Exception as e:
@@ -428,6 +557,7 @@ class WindowClass(QMainWindow, uic.loadUiType(resource_path("ui/main_window.ui")
         if not self.aircok_files:
             QMessageBox.warning(self, "파일 없음", "먼저 Aircok 파일을 선택해주세요.")
             return
+        from utils.compare_graph import GraphCompareDialog
         dlg = GraphCompareDialog(
             self,
             aircok_file=self.aircok_files[self.current_file_index],
@@ -450,7 +580,10 @@ class AboutWindow(QDialog):
         self.setWindowTitle("About")
 
 if __name__ == "__main__":
+    freeze_support()
     app = QApplication(sys.argv)
     mainWindow = WindowClass()
     mainWindow.show()
+    mainWindow.report_startup_time(time.perf_counter() - _START_TIME)
+    QTimer.singleShot(0, mainWindow.start_warmup)
     sys.exit(app.exec_())
\ No newline at end of file
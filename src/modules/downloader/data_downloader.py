@@ -6,13 +6,15 @@ import pandas as pd
 from PyQt5.uic import loadUi
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QFileDialog, QMessageBox,
-    QDialog, QVBoxLayout, QLabel, QProgressBar
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QComboBox
 )
 from PyQt5.QtCore import QDateTime, Qt
 from sqlalchemy import create_engine
 from sqlalchemy.exc import ProgrammingError
 from dotenv import load_dotenv
 
+from src.utils.table_io import TABLE_FORMATS, available_formats, write_table
+
 base_dir = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(base_dir, ".env"))
 
@@ -58,6 +60,14 @@ class DataDownloader(QWidget):
         self.dateTimeEdit.setDateTime(now)
         self.dateTimeEdit_2.setDateTime(now)
 
+        # 저장 형식: Parquet / Feather 는 날짜(datetime64)와 센서 값(float32)을 타입 그대로 저장한다
+        self.formatCombo = QComboBox()
+        self.formatCombo.addItems([fmt.upper() for fmt in available_formats()])
+        format_layout = QHBoxLayout()
+        format_layout.addWidget(QLabel("저장 형식"))
+        format_layout.addWidget(self.formatCombo)
+        self.verticalLayout_2.insertLayout(self.verticalLayout_2.indexOf(self.downloadButton), format_layout)
+
         self.downloadButton.clicked.connect(self.download_data)
         self.checkAllBox.stateChanged.connect(self.toggle_all_checks)
 
@@ -154,10 +164,11 @@ class DataDownloader(QWidget):
         progress_dialog.show()
 
         failures = []
+        output_format = self.formatCombo.currentText().lower()
 
         for idx, i in enumerate(range(start_num, end_num + 1), 1):
             sn = f"{prefix}{str(i).zfill(len(number_part))}"
-            filename = f"{sn.replace('dvc_', '')}.csv"
+            filename = f"{sn.replace('dvc_', '')}{TABLE_FORMATS[output_format]}"
             file_path = os.path.join(folder, filename)
 
             query = f"""
@@ -169,7 +180,7 @@ class DataDownloader(QWidget):
 
             try:
                 df = pd.read_sql_query(query, engine)
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
+                write_table(df, file_path)
                 print(f"[{idx}] {filename} 저장 완료")
             except ProgrammingError as pe:
                 print(f"[{idx}] {filename} 실패 (테이블 없음): {pe}")
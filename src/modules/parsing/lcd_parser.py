@@ -0,0 +1,401 @@
+import os
+import json
+import mmap
+import locale
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from src.utils.table_io import TABLE_FORMATS, BinaryTableWriter, is_binary_table
+
+# LCD 로그 레코드 구조 (고정 폭)
+# [0:32] 헤더 | [32:45] 날짜 "YYYYMMDD,HHMM" | 이후 16자 블록 x 10 (",코드," 7 + 값 7 + 상태 2)
+COLUMNS = ["date", "pm2.5", "pm10", "temp", "humi", "noise", "hcho", "co2", "co", "voc", "no2"]
+MEASUREMENT = {",10008,": "pm2.5", ",10007,": "pm10", ",20003,": "temp", ",20004,": "humi",
+               ",40001,": "noise", ",50001,": "hcho", ",30006,": "co2", ",10002,": "co",
+               ",50002,": "voc", ",10006,": "no2"}
+STX = 32
+CATEGORY = 7
+DATA_LENGTH = 7
+DEV_STATE = 2
+DATE_LENGTH = 13
+BLOCK_SIZE = CATEGORY + DATA_LENGTH + DEV_STATE
+BLOCK_COUNT = len(COLUMNS) - 1
+RECORD_LENGTH = STX + DATE_LENGTH + BLOCK_COUNT * BLOCK_SIZE
+DATE_FORMAT = "%Y%m%d,%H%M"
+FALLBACK_DATE = np.datetime64("1970-01-01T00:00")
+DATE_DIGITS = [0, 1, 2, 3, 4, 5, 6, 7, 9, 10, 11, 12]
+ZERO = ord("0")
+COMMA = ord(",")
+MEASUREMENT_COLUMNS = list(MEASUREMENT.values())
+_code_order = sorted(MEASUREMENT, key=lambda code: int(code.strip(",")))
+CODE_NUMBERS = np.array([int(code.strip(",")) for code in _code_order])
+CODE_COLUMNS = np.array([MEASUREMENT_COLUMNS.index(MEASUREMENT[code]) for code in _code_order])
+CHUNK_SIZE = 16 * 1024 * 1024  # 스트리밍 변환 시 한 번에 읽을 로그 크기 (문자 수)
+CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+HEAD_BYTES = 4096  # 로그 교체 여부를 확인할 때 비교하는 앞부분 크기
+
+
+def _field(chars, start, length):
+    # (레코드 수 x 폭) 문자 행렬에서 고정 폭 열을 잘라 문자열 배열로 되돌린다. 짧은 줄은 잘린 만큼만 남는다.
+    return np.ascontiguousarray(chars[:, start:start + length]).view(f"U{length}").ravel()
+
+
+def _digits(block):
+    # 숫자 문자 블록 → 정수 (모든 칸이 숫자라고 가정)
+    out = np.zeros(len(block), dtype=np.int64)
+    for i in range(block.shape[1]):
+        out = out * 10 + (block[:, i].astype(np.int64) - ZERO)
+    return out
+
+
+def _parse_dates(date_chars, lines, file_name):
+    """
+    "YYYYMMDD,HHMM" 날짜 블록을 datetime64 로 변환한다. 실패한 줄은 1970-01-01 00:00 으로 두고 error_log 에 남긴다.
+    형식이 정확히 맞는 줄은 자릿수 연산으로 바로 계산하고, 나머지만 pandas 의 strptime 경로로 넘긴다.
+    """
+    date_chars = date_chars.copy()
+    date_len = (date_chars != 0).sum(axis=1)
+
+    # 24시는 00시로 바꾼다 (앞쪽 ',' 제거와 무관하게 끝에서 4~3번째 글자가 시각의 앞 두 자리)
+    stripped_len = np.char.str_len(np.char.lstrip(_field(date_chars, 0, DATE_LENGTH), ","))
+    rows = np.flatnonzero(stripped_len >= 4)
+    hour_pos = date_len[rows] - 4
+    rows = rows[(date_chars[rows, hour_pos] == ord("2")) & (date_chars[rows, hour_pos + 1] == ord("4"))]
+    date_chars[rows, date_len[rows] - 4] = ZERO
+    date_chars[rows, date_len[rows] - 3] = ZERO
+
+    is_digit = (date_chars >= ZERO) & (date_chars <= ZERO + 9)
+    simple = is_digit[:, DATE_DIGITS].all(axis=1) & (date_chars[:, 8] == COMMA)
+    year, month = _digits(date_chars[:, 0:4]), _digits(date_chars[:, 4:6])
+    day, hour, minute = _digits(date_chars[:, 6:8]), _digits(date_chars[:, 9:11]), _digits(date_chars[:, 11:13])
+    simple &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (hour <= 23) & (minute <= 59)
+
+    month_start = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype("datetime64[M]")
+    days_in_month = ((month_start + 1).astype("datetime64[D]") - month_start.astype("datetime64[D]")).astype(np.int64)
+    simple &= day <= days_in_month
+    parsed = (month_start.astype("datetime64[D]") + (day - 1)).astype("datetime64[m]") + (hour * 60 + minute)
+    parsed = parsed.astype("datetime64[ns]")
+
+    rest = np.flatnonzero(~simple)
+    if len(rest):
+        dates = np.char.lstrip(_field(date_chars[rest], 0, DATE_LENGTH), ",")
+        parsed[rest] = pd.to_datetime(pd.Series(dates, dtype=object), format=DATE_FORMAT, errors="coerce").to_numpy()
+
+    failed = np.isnat(parsed)
+    parsed[failed] = FALLBACK_DATE
+    error_log = [{"file_name": file_name, "line": lines[i]} for i in np.flatnonzero(failed)]
+    return parsed, error_log
+
+
+def _parse_values(value_chars):
+    """
+    값 블록(7자)을 float 로 변환한다. 빈 값은 NaN.
+    숫자와 소수점 하나로만 된 값은 자릿수 연산으로 계산하고(float() 와 같은 결과), 그 밖의 값만 문자열 변환을 쓴다.
+    잘못된 값은 기존과 같이 ValueError 를 낸다.
+    """
+    is_digit = (value_chars >= ZERO) & (value_chars <= ZERO + 9)
+    is_dot = value_chars == ord(".")
+    is_null = value_chars == 0
+    empty = is_null.all(axis=1)
+    simple = (is_digit | is_dot | is_null).all(axis=1) & (is_dot.sum(axis=1) <= 1) & is_digit.any(axis=1)
+
+    mantissa = np.zeros(len(value_chars), dtype=np.int64)
+    decimals = np.zeros(len(value_chars), dtype=np.int64)
+    after_dot = np.zeros(len(value_chars), dtype=bool)
+    for i in range(value_chars.shape[1]):
+        digit = is_digit[:, i]
+        mantissa = np.where(digit, mantissa * 10 + (value_chars[:, i].astype(np.int64) - ZERO), mantissa)
+        after_dot |= is_dot[:, i]
+        decimals += digit & after_dot
+
+    out = np.full(len(value_chars), np.nan)
+    out[simple] = mantissa[simple] / 10.0 ** decimals[simple]
+    rest = ~simple & ~empty
+    if rest.any():
+        out[rest] = _field(value_chars[rest], 0, value_chars.shape[1]).astype(np.float64)
+    return out
+
+
+def parse_lcd_records(lines, file_name=""):
+    """
+    레코드 줄 목록을 한 번에 파싱한다.
+    반환: ({컬럼: 값 배열}, error_log) — 컬럼마다 길이가 다를 수 있으며 records_to_frame 에서 맞춘다.
+    """
+    n = len(lines)
+    if n == 0:
+        columns = {col: np.array([], dtype=float) for col in MEASUREMENT_COLUMNS}
+        return {"date": np.array([], dtype="datetime64[ns]"), **columns}, []
+
+    # 각 줄을 RECORD_LENGTH 폭 문자 행렬로 만든다 (남는 칸은 '\0', 넘치는 부분은 사용하지 않음)
+    chars = np.array(lines, dtype=f"U{RECORD_LENGTH}").view(np.uint32).reshape(n, RECORD_LENGTH)
+    parsed, error_log = _parse_dates(chars[:, STX:STX + DATE_LENGTH], lines, file_name)
+
+    # 블록 위치별 코드를 (줄 x 블록) 순서로 펼쳐 ",NNNNN," 형식의 코드를 컬럼 번호로 바꾼다
+    blocks = chars[:, STX + DATE_LENGTH:].reshape(n * BLOCK_COUNT, BLOCK_SIZE)
+    code_digits = blocks[:, 1:CATEGORY - 1]
+    code_ok = ((blocks[:, 0] == COMMA) & (blocks[:, CATEGORY - 1] == COMMA)
+               & ((code_digits >= ZERO) & (code_digits <= ZERO + 9)).all(axis=1))
+    code_num = np.where(code_ok, _digits(code_digits), -1)
+    pos = np.clip(np.searchsorted(CODE_NUMBERS, code_num), 0, len(CODE_NUMBERS) - 1)
+    col_idx = np.where(CODE_NUMBERS[pos] == code_num, CODE_COLUMNS[pos], -1)
+
+    # 코드가 가리키는 컬럼에 줄 순서대로 값을 붙인다 (블록 위치가 아니라 코드 기준)
+    keep = np.flatnonzero(col_idx >= 0)
+    values = _parse_values(blocks[keep, CATEGORY:CATEGORY + DATA_LENGTH])
+    col_idx = col_idx[keep]
+    order = np.argsort(col_idx, kind="stable")
+    bounds = np.searchsorted(col_idx[order], np.arange(len(MEASUREMENT_COLUMNS) + 1))
+
+    columns = {"date": parsed}
+    for i, col in enumerate(MEASUREMENT_COLUMNS):
+        columns[col] = values[order[bounds[i]:bounds[i + 1]]]
+    return columns, error_log
+
+
+def records_to_frame(parts):
+    # 여러 파일/구간의 결과를 컬럼별로 이어 붙이고, 짧은 컬럼은 뒤를 빈 값으로 채운다.
+    columns = {col: np.concatenate([part[col] for part in parts]) if parts else np.array([], dtype=float)
+               for col in COLUMNS}
+    df = pd.DataFrame({col: pd.Series(values) for col, values in columns.items()})
+    return df[COLUMNS]
+
+
+def iter_record_chunks(path, resolution, chunk_size=CHUNK_SIZE, start=0, complete_only=False):
+    """
+    로그를 start 바이트부터 chunk_size 만큼씩 읽어 (레코드 줄 목록, 다음 읽을 바이트 위치) 를 차례로 돌려준다.
+    파일 전체를 메모리에 올리지 않으므로 큰 로그도 일정한 메모리로 처리할 수 있다.
+    complete_only 이면 줄바꿈으로 끝나지 않은 마지막 줄(기록 중인 줄)은 읽지 않는다.
+    디코딩과 줄바꿈 처리는 open() 의 텍스트 모드와 같다.
+    """
+    encoding = locale.getpreferredencoding(False)
+    try:
+        pattern = resolution.encode(encoding)
+        byte_scan = bool(pattern) and "\r\n".encode(encoding) == b"\r\n" and os.path.getsize(path) > start
+    except (UnicodeError, LookupError):
+        byte_scan = False
+    if byte_scan:
+        yield from _scan_record_chunks(path, resolution, pattern, encoding, chunk_size, start, complete_only)
+    else:
+        yield from _read_record_chunks(path, resolution, encoding, chunk_size, start, complete_only)
+
+
+def _record_spans(window, pattern, has_cr):
+    """
+    바이트 배열에서 pattern 이 들어 있는 줄들의 (시작, 끝) 구간을 찾는다. 끝은 줄바꿈 문자 하나를 포함한다.
+    줄마다 객체를 만들지 않고 배열 연산으로 찾는다. 줄 구분은 텍스트 모드와 같이 '\n', '\r' 둘 다.
+    """
+    size = len(window) - len(pattern) + 1
+    if size <= 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    hits = np.flatnonzero(window[:size] == pattern[0])
+    for i in range(1, len(pattern)):
+        hits = hits[window[hits + i] == pattern[i]]
+
+    breaks = window == 0x0A
+    if has_cr:
+        breaks |= window == 0x0D
+    breaks = np.flatnonzero(breaks)
+    line_no = np.unique(np.searchsorted(breaks, hits))
+    starts = np.where(line_no > 0, breaks[np.maximum(line_no - 1, 0)] + 1, 0)
+    ends = np.where(line_no < len(breaks), breaks[np.minimum(line_no, len(breaks) - 1)] + 1, len(window))
+
+    # 바로 이어지는 줄들은 한 구간으로 합친다 (레코드가 대부분인 로그는 구간 몇 개로 줄어든다)
+    first = np.ones(len(starts), dtype=bool)
+    first[1:] = starts[1:] != ends[:-1]
+    last = np.ones(len(starts), dtype=bool)
+    last[:-1] = first[1:]
+    return starts[first], ends[last]
+
+
+def _scan_record_chunks(path, resolution, pattern, encoding, chunk_size, start, complete_only):
+    # 로그를 메모리 매핑해 구간마다 바이트 단위로 레코드 줄을 찾고, 찾은 줄만 디코딩한다
+    pattern = np.frombuffer(pattern, dtype=np.uint8)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offset = start
+        while offset < len(mm):
+            end = min(offset + chunk_size, len(mm))
+            cut = mm.rfind(b"\n", offset, end) + 1
+            while not cut and end < len(mm):
+                end = min(end + chunk_size, len(mm))
+                cut = mm.rfind(b"\n", offset, end) + 1
+            if end == len(mm) and not complete_only:
+                cut = end
+            if not cut:
+                break
+
+            window = np.frombuffer(mm, dtype=np.uint8, count=cut - offset, offset=offset)
+            starts, ends = _record_spans(window, pattern, mm.find(b"\r", offset, cut) >= 0)
+            del window
+            data = b"".join([mm[offset + s:offset + e] for s, e in zip(starts.tolist(), ends.tolist())])
+            # 멀티바이트 인코딩의 두 번째 바이트와 우연히 겹친 경우는 디코딩 후 한 번 더 걸러낸다
+            text = data.decode(encoding).replace("\r", "\n")
+            offset = cut
+            yield [line for line in text.split("\n") if resolution in line], offset
+
+
+def _read_record_chunks(path, resolution, encoding, chunk_size, start, complete_only):
+    # ASCII 와 호환되지 않는 인코딩 등 바이트 검색을 쓸 수 없을 때의 경로
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        rest = b""
+        while True:
+            block = f.read(chunk_size)
+            data = rest + block
+            if block:
+                cut = data.rfind(b"\n") + 1
+                data, rest = data[:cut], data[cut:]
+            elif complete_only or not data:
+                break
+            else:
+                rest = b""
+            if data:
+                offset += len(data)
+                text = data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+                yield [line for line in text.split("\n") if resolution in line], offset
+            if not block:
+                break
+
+
+class RecordWriter:
+    """
+    파싱된 컬럼 배열을 구간마다 CSV (또는 확장자에 따라 Parquet / Feather) 에 이어 쓴다.
+    컬럼 길이가 서로 다르면 모든 컬럼이 채워진 행까지만 쓰고 나머지는 다음 구간으로 넘기며,
+    close() 에서 남은 값을 빈 값으로 채워 마저 쓴다. 결과는 전체를 한 번에 변환한 것과 같다.
+    append 는 CSV 에서만 쓸 수 있다.
+    """
+
+    def __init__(self, save_path, encoding="cp949", append=False):
+        self.save_path = save_path
+        self.encoding = encoding
+        self.pending = {col: [] for col in COLUMNS}
+        self.rows = 0
+        self.last_date = None
+        self.append = append
+        self._header = not append
+        self._binary = BinaryTableWriter(save_path, COLUMNS) if is_binary_table(save_path) else None
+
+    def write(self, columns):
+        for col in COLUMNS:
+            self.pending[col].append(columns[col])
+        ready = min(sum(len(values) for values in self.pending[col]) for col in COLUMNS)
+        if ready:
+            self._flush(ready)
+
+    def close(self):
+        remaining = any(len(values) for parts in self.pending.values() for values in parts)
+        if (self._header and not self.append) or remaining:
+            self._flush(None)
+        if self._binary is not None:
+            self._binary.close()
+
+    def _flush(self, count):
+        out = {}
+        for col in COLUMNS:
+            values = np.concatenate(self.pending[col]) if self.pending[col] else np.array([], dtype=float)
+            out[col] = values[:count]
+            self.pending[col] = [values[count:]] if count is not None else []
+        df = records_to_frame([out])
+        if self._binary is not None:
+            self._binary.write(df)
+        else:
+            df.to_csv(self.save_path, mode="a" if self.append or not self._header else "w", header=self._header,
+                      index=False, encoding=self.encoding, date_format=CSV_DATE_FORMAT)
+        self._header = False
+        self.rows += len(df)
+        dates = df["date"].dropna()
+        if len(dates):
+            self.last_date = dates.iloc[-1]
+
+
+def _head_digest(path, size):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read(min(size, HEAD_BYTES))).hexdigest()
+
+
+def load_manifest(txt_file, save_path):
+    """
+    증분 변환 기록(<csv>.manifest.json)을 읽는다.
+    로그가 잘리거나 교체되었거나, CSV 가 기록 이후 바뀌었으면 None 을 돌려 처음부터 다시 변환하게 한다.
+    """
+    try:
+        with open(save_path + MANIFEST_SUFFIX, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if (manifest.get("version") != MANIFEST_VERSION
+                or manifest["source"] != os.path.abspath(txt_file)
+                or os.path.getsize(txt_file) < manifest["offset"]
+                or os.path.getsize(save_path) != manifest["csv_size"]
+                or _head_digest(txt_file, manifest["offset"]) != manifest["head"]):
+            return None
+        return manifest
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_manifest(txt_file, save_path, offset, last_date, rows):
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": os.path.abspath(txt_file),
+        "offset": offset,
+        "head": _head_digest(txt_file, offset),
+        "last_date": None if last_date is None else str(last_date),
+        "rows": rows,
+        "csv_size": os.path.getsize(save_path),
+    }
+    tmp_path = save_path + MANIFEST_SUFFIX + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, save_path + MANIFEST_SUFFIX)
+    return manifest
+
+
+def convert_lcd_file(txt_file, dir_path, chunk_size=CHUNK_SIZE, progress=None, incremental=False,
+                     output_format="csv"):
+    """
+    LCD 로그 하나를 <dir_path>/<파일명>.csv (output_format 에 따라 .parquet / .feather) 로 변환한다.
+    일괄 변환의 작업 프로세스에서도 호출된다. progress(읽은 크기, 전체 크기) 가 주어지면 구간마다 호출한다.
+    incremental 이면 manifest 에 기록된 위치 이후에 추가된 레코드만 파싱해 기존 CSV 뒤에 붙인다.
+    Parquet / Feather 는 이어 쓸 수 없으므로 항상 처음부터 변환한다.
+    반환: (저장 경로, error_log)
+    """
+    resolution = os.path.basename(txt_file)[:4]
+    total = os.path.getsize(txt_file) or 1
+    error_log = []
+    save_path = os.path.join(dir_path, f"{os.path.basename(txt_file)}{TABLE_FORMATS[output_format]}")
+    incremental = incremental and output_format == "csv"
+
+    manifest = load_manifest(txt_file, save_path) if incremental else None
+    start = manifest["offset"] if manifest else 0
+    writer = RecordWriter(save_path, append=manifest is not None)
+    offset = start
+    for lines, offset in iter_record_chunks(txt_file, resolution, chunk_size, start, complete_only=incremental):
+        columns, errors = parse_lcd_records(lines, os.path.basename(txt_file))
+        writer.write(columns)
+        error_log.extend(errors)
+        if progress is not None:
+            progress(offset, total)
+    writer.close()
+
+    if incremental:
+        last_date = writer.last_date if writer.last_date is not None else (manifest or {}).get("last_date")
+        save_manifest(txt_file, save_path, offset, last_date, writer.rows + (manifest["rows"] if manifest else 0))
+    return save_path, error_log
+
+
+def read_lcd_log(txt_file, chunk_size=CHUNK_SIZE):
+    # LCD 로그를 CSV 로 저장하지 않고 바로 DataFrame 으로 읽는다 (변환한 CSV 를 다시 읽은 것과 같은 컬럼/값)
+    resolution = os.path.basename(txt_file)[:4]
+    parts = [parse_lcd_records(lines, os.path.basename(txt_file))[0]
+             for lines, _ in iter_record_chunks(txt_file, resolution, chunk_size)]
+    return records_to_frame(parts)
+
+
+def write_error_manifest(error_log, save_path):
+    # 날짜를 읽지 못한 줄 목록 (file_name, line) 을 CSV 로 남긴다
+    pd.DataFrame(error_log, columns=["file_name", "line"]).to_csv(
+        save_path, index=False, encoding="cp949", errors="replace")
+    return save_path
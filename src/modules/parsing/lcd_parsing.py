@@ -1,99 +1,115 @@
 import sys
 import os
-import copy
-import pandas as pd
+from collections import defaultdict
 from glob import glob
-from datetime import datetime
-from PyQt5.QtWidgets import QDialog, QFileDialog, QMessageBox
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from PyQt5.QtWidgets import QDialog, QFileDialog, QMessageBox, QMenu, QAction, QActionGroup, QInputDialog
 from PyQt5.uic import loadUi
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from src.modules.parsing.lcd_parser import CHUNK_SIZE, convert_lcd_file, write_error_manifest
+from src.utils.table_io import available_formats
+
 
 def resource_path(relative_path):
     base_path = getattr(sys, "_MEIPASS", os.path.abspath("."))
     return os.path.join(base_path, relative_path)
 
 
+WINDOW_TITLE = "Aircok Log Converter v1.3.0"
+ERROR_MANIFEST_NAME = "conversion_errors.csv"
+DEFAULT_CONVERT_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+
+def duplicate_basenames(file_paths):
+    # 결과 파일은 <저장 경로>/<파일명>.csv 이므로 하위 폴더가 달라도 파일명이 같으면 서로 덮어쓴다
+    by_name = defaultdict(list)
+    for path in file_paths:
+        by_name[os.path.normcase(os.path.basename(path))].append(path)
+    return {name: paths for name, paths in by_name.items() if len(paths) > 1}
+
+
 class ConvertThread(QThread):
     progress_signal = pyqtSignal(str, str)
 
-    def __init__(self, txt_file, dir_path, parent=None):
+    def __init__(self, txt_file, dir_path, parent=None, chunk_size=CHUNK_SIZE, error_manifest=False,
+                 incremental=False, output_format="csv"):
         super().__init__(parent)
         self.txt_file = txt_file
         self.dir_path = dir_path
+        self.chunk_size = chunk_size
+        self.error_manifest = error_manifest
+        self.incremental = incremental
+        self.output_format = output_format
 
     def run(self):
         try:
-            resolution = os.path.basename(self.txt_file)[:4]
-            content = {col: [] for col in ["date", "pm2.5", "pm10", "temp", "humi", "noise", "hcho", "co2", "co", "voc", "no2"]}
-            measurement = {",10008,": "pm2.5", ",10007,": "pm10", ",20003,": "temp", ",20004,": "humi",
-                           ",40001,": "noise", ",50001,": "hcho", ",30006,": "co2", ",10002,": "co",
-                           ",50002,": "voc", ",10006,": "no2"}
-            error_log = []
-            STX = 32
-            CATEGORY = 7
-            DATA_LENGTH = 7
-            DEV_STATE = 2
-            DATA = {
-                "date": 13,
-                "pm2.5": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "pm10": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "temp": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "humi": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "noise": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "hcho": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "co2": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "co": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "voc": CATEGORY + DATA_LENGTH + DEV_STATE,
-                "no2": CATEGORY + DATA_LENGTH + DEV_STATE
-            }
-
             if not os.path.isfile(self.txt_file):
                 self.progress_signal.emit("에러 발생", "파일이 유효하지 않습니다.")
                 return
 
-            for file in glob(self.txt_file, recursive=True):
-                with open(file) as f:
-                    for line in f.readlines():
-                        if "\n" in line:
-                            line = line[:-1]
-                        if resolution in line:
-                            start = STX
-                            for col in content.keys():
-                                if col in measurement.values():
-                                    block_size = CATEGORY + DATA_LENGTH + DEV_STATE
-                                    code = line[start: (start + block_size)][:CATEGORY]
-                                    if code in measurement:
-                                        measured_data = line[start: (start + block_size)][CATEGORY: (block_size - DEV_STATE)]
-                                        content[measurement[code]].append(float(measured_data) if measured_data != "" else "")
-                                elif col == "date":
-                                    try:
-                                        date_temp = str(line[start: (start + DATA[col])])
-                                        date_temp = date_temp.lstrip(',')
-                                        if date_temp[-4:-2] == "24":
-                                            date_temp = date_temp[:-4] + "00" + date_temp[-2:]
-                                        content[col].append(datetime.strptime(date_temp, "%Y%m%d,%H%M"))
-                                    except Exception:
-                                        error_log.append({"file_name": file.split("/")[-1], "line": line})
-                                        content[col].append(datetime.strptime("197001010000", "%Y%m%d%H%M"))
-                                else:
-                                    content[col].append(line[start: (start + DATA[col])])
-                                start += DATA[col]
-
-            max_length = max(len(content[key]) for key in content.keys())
-            for key in content.keys():
-                while len(content[key]) < max_length:
-                    content[key].append(None)
-
-            result = copy.deepcopy(content)
-            df = pd.DataFrame(result)
-            save_path = os.path.join(self.dir_path, f"{os.path.basename(self.txt_file)}.csv")
-            df.to_csv(save_path, index=False, encoding="cp949")
+            # 로그를 구간 단위로 읽어 파싱한 뒤 바로 CSV 에 이어 쓴다 (메모리 사용량은 구간 크기로 제한)
+            def progress(done, total):
+                self.progress_signal.emit("변환 중", f"{min(99, done * 100 // total)}%")
+
+            save_path, error_log = convert_lcd_file(self.txt_file, self.dir_path, self.chunk_size, progress,
+                                                    self.incremental, self.output_format)
+            if self.error_manifest and error_log:
+                write_error_manifest(error_log, os.path.join(self.dir_path, ERROR_MANIFEST_NAME))
             self.progress_signal.emit("변환 완료", save_path)
         except Exception as e:
             self.progress_signal.emit("에러 발생", str(e))
 
 
+class BatchConvertThread(QThread):
+    """
+    여러 로그를 작업 프로세스에 나눠 변환한다. 파일마다 진행 상황을 알리고,
+    실패한 파일은 건너뛴 뒤 마지막에 모아서 알린다.
+    """
+    progress_signal = pyqtSignal(str, str)
+
+    def __init__(self, txt_files, dir_path, parent=None, workers=DEFAULT_CONVERT_WORKERS, error_manifest=False,
+                 incremental=False, output_format="csv"):
+        super().__init__(parent)
+        self.txt_files = txt_files
+        self.dir_path = dir_path
+        self.workers = workers
+        self.error_manifest = error_manifest
+        self.incremental = incremental
+        self.output_format = output_format
+
+    def run(self):
+        try:
+            total = len(self.txt_files)
+            error_log = []
+            failed = []
+            workers = max(1, min(self.workers, total))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(convert_lcd_file, file, self.dir_path, CHUNK_SIZE, None, self.incremental,
+                                    self.output_format): file
+                    for file in self.txt_files
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    name = os.path.basename(futures[future])
+                    try:
+                        _, errors = future.result()
+                        error_log.extend(errors)
+                    except Exception as e:
+                        failed.append(f"{name}: {e}")
+                    self.progress_signal.emit("변환 중", f"{done}/{total} {name}")
+
+            summary = f"{total - len(failed)}/{total}개 파일 → {self.dir_path}"
+            if self.error_manifest and error_log:
+                manifest = write_error_manifest(error_log, os.path.join(self.dir_path, ERROR_MANIFEST_NAME))
+                summary += f"\n날짜 오류 {len(error_log)}줄: {manifest}"
+            if failed:
+                summary += "\n\n실패한 파일:\n" + "\n".join(failed)
+            self.progress_signal.emit("일괄 변환 완료", summary)
+        except Exception as e:
+            self.progress_signal.emit("에러 발생", str(e))
+
+
 class LogConverterApp(QDialog):
     def __init__(self):
         super().__init__()
@@ -101,17 +117,39 @@ class LogConverterApp(QDialog):
         if not os.path.exists(ui_path):
             raise FileNotFoundError(f"UI 파일이 존재하지 않습니다: {ui_path}")
         loadUi(ui_path, self)
-        self.setWindowTitle("Aircok Log Converter v1.3.0")
+        self.setWindowTitle(WINDOW_TITLE)
 
 
         self.dir_path = None
         self.txt_file = None
+        self.txt_files = []
         self.convert_thread = None
 
         self.select_save_path.clicked.connect(self.select_path)
-        self.select_aircok_file_path.clicked.connect(self.txt_file_open)
         self.conversion.clicked.connect(self.start_convert)
 
+        # 변환할 파일 선택 버튼: 파일 하나 / 여러 파일, 폴더, 패턴(glob) 일괄 선택
+        file_menu = QMenu(self)
+        file_menu.addAction("파일 선택", self.txt_file_open)
+        file_menu.addAction("폴더 선택 (일괄 변환)", self.txt_folder_open)
+        file_menu.addAction("패턴 입력 (일괄 변환)", self.txt_pattern_open)
+        file_menu.addSeparator()
+        self.error_manifest_action = QAction("날짜 오류 목록 저장", self, checkable=True)
+        file_menu.addAction(self.error_manifest_action)
+        # 이어서 변환: 지난 변환 이후 로그에 추가된 레코드만 기존 CSV 뒤에 붙인다 (<csv>.manifest.json 에 위치 기록)
+        self.incremental_action = QAction("이어서 변환 (추가된 기록만)", self, checkable=True)
+        file_menu.addAction(self.incremental_action)
+        # 저장 형식: Parquet / Feather 는 날짜와 센서 값을 타입 그대로 저장해 보정/보고서에서 바로 읽는다
+        format_menu = file_menu.addMenu("저장 형식")
+        self.format_group = QActionGroup(self)
+        for fmt in available_formats():
+            action = format_menu.addAction(fmt.upper())
+            action.setCheckable(True)
+            action.setData(fmt)
+            action.setChecked(fmt == "csv")
+            self.format_group.addAction(action)
+        self.select_aircok_file_path.setMenu(file_menu)
+
     def select_path(self):
         dir_path = QFileDialog.getExistingDirectory(self, "저장할 위치 선택")
         if dir_path:
@@ -119,17 +157,52 @@ class LogConverterApp(QDialog):
             QMessageBox.information(self, "경로 선택", f"저장 경로가 설정되었습니다:\n{self.dir_path}")
 
     def txt_file_open(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "변환할 파일 선택", "", "TXT Files (*.txt)")
-        if file_path:
-            self.txt_file = file_path
+        file_paths, _ = QFileDialog.getOpenFileNames(self, "변환할 파일 선택", "", "TXT Files (*.txt)")
+        if len(file_paths) == 1:
+            self.txt_file, self.txt_files = file_paths[0], []
             QMessageBox.information(self, "파일 선택", f"파일이 선택되었습니다:\n{self.txt_file}")
+        elif file_paths:
+            self.set_batch_files(file_paths, "선택한 파일")
+
+    def txt_folder_open(self):
+        folder = QFileDialog.getExistingDirectory(self, "변환할 로그 폴더 선택")
+        if folder:
+            self.set_batch_files(glob(os.path.join(folder, "**", "*.txt"), recursive=True), folder)
+
+    def txt_pattern_open(self):
+        pattern, ok = QInputDialog.getText(self, "패턴 입력", "변환할 로그 경로 패턴 (예: D:/logs/**/*.txt)")
+        if ok and pattern:
+            self.set_batch_files(glob(pattern, recursive=True), pattern)
+
+    def set_batch_files(self, file_paths, source):
+        file_paths = sorted(path for path in file_paths if os.path.isfile(path))
+        if not file_paths:
+            QMessageBox.warning(self, "경고", f"변환할 파일이 없습니다:\n{source}")
+            return
+        duplicates = duplicate_basenames(file_paths)
+        if duplicates:
+            listing = "\n".join(path for paths in duplicates.values() for path in paths)
+            QMessageBox.warning(self, "경고", "파일명이 같은 로그가 있어 결과 파일이 겹칩니다. "
+                                            f"폴더를 나눠 따로 변환해 주세요:\n{listing}")
+            return
+        self.txt_file, self.txt_files = None, file_paths
+        QMessageBox.information(self, "파일 선택", f"{len(file_paths)}개 파일이 선택되었습니다:\n{source}")
 
     def start_convert(self):
-        if not self.dir_path or not self.txt_file:
+        if not self.dir_path or not (self.txt_file or self.txt_files):
             QMessageBox.warning(self, "경고", "저장할 위치와 파일을 선택해 주세요!")
             return
 
-        self.convert_thread = ConvertThread(self.txt_file, self.dir_path, self)
+        error_manifest = self.error_manifest_action.isChecked()
+        incremental = self.incremental_action.isChecked()
+        output_format = self.format_group.checkedAction().data()
+        if self.txt_files:
+            self.convert_thread = BatchConvertThread(self.txt_files, self.dir_path, self,
+                                                     error_manifest=error_manifest, incremental=incremental,
+                                                     output_format=output_format)
+        else:
+            self.convert_thread = ConvertThread(self.txt_file, self.dir_path, self, error_manifest=error_manifest,
+                                                incremental=incremental, output_format=output_format)
         self.convert_thread.finished.connect(self.cleanup_thread)
         self.convert_thread.progress_signal.connect(self.show_message)
         self.convert_thread.start()
@@ -138,9 +211,14 @@ class LogConverterApp(QDialog):
     def cleanup_thread(self):
         self.convert_thread = None
         self.setEnabled(True)
+        self.setWindowTitle(WINDOW_TITLE)
 
     def show_message(self, message, file_path):
-        if "변환 완료" in message:
+        if message == "변환 중":
+            self.setWindowTitle(f"{WINDOW_TITLE} - 변환 중 {file_path}")
+        elif message == "일괄 변환 완료":
+            QMessageBox.information(self, "알림", f"{message}\n{file_path}")
+        elif "변환 완료" in message:
             QMessageBox.information(self, "알림", f"{message}: {file_path}")
         else:
             QMessageBox.critical(self, "에러", f"{message}")
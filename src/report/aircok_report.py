@@ -1,7 +1,21 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from src.report.data_quality import quality_frame, unit_quality
+from src.report.report_manifest import is_unchanged, load_report_manifest, save_report_manifest, unit_record
+from src.report.report_writer import DEFAULT_WRITER_MODE, EXCEL_MAX_ROWS, open_report_writer
+from src.utils.file_cache import cached_read
+from src.utils.table_io import (
+    is_binary_table, is_lcd_log, read_sensor_csv, read_table, read_table_columns, restore_float32_columns
+)
+
+# 시간 집계 보고서에서 유닛/센서마다 구하는 값
+RESAMPLE_AGGREGATES = ['mean', 'min', 'max', 'count']
+# 보고서 파일을 동시에 읽는 스레드 수 (읽기는 대부분 디스크 대기와 GIL 을 놓는 파싱)
+DEFAULT_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def format_date_columns(df):
     if 'date' in df.columns:
@@ -9,39 +23,156 @@ def format_date_columns(df):
         df = df.dropna(subset=['date'])
     return df
 
-def prepare_simple_sheet(sensor_name, dfs, file_labels):
-    merged_df = pd.DataFrame()
-    valid_labels = []
+def read_report_file(path, columns=None):
+    # Parquet / Feather 의 float32 값은 보고서에 CSV 와 같은 값으로 보이도록 float64 로 되돌린다
+    if is_binary_table(path) or is_lcd_log(path):
+        df = restore_float32_columns(read_table(path, columns=columns))
+    else:
+        df = read_sensor_csv(path, columns=columns)
+    return format_date_columns(df)
 
-    for df, label in zip(dfs, file_labels):
-        if sensor_name not in df.columns or 'date' not in df.columns:
-            continue
+def load_report_file(path):
+    return cached_read(path, read_report_file, "report")
 
-        temp_df = df[['date', sensor_name]].drop_duplicates('date').copy()
-        temp_df = temp_df.rename(columns={sensor_name: label})
-        valid_labels.append(label)
+def read_report_columns(path, columns=None):
+    # LCD 로그는 컬럼만 골라 읽을 수 없으므로 한 번 파싱해 캐시에 두고 거기서 고른다 (로그 하나는 통째로 메모리에 올라온다)
+    if is_lcd_log(path):
+        df = load_report_file(path)
+        return df if columns is None else df[columns]
+    return read_report_file(path, columns=columns)
 
-        if merged_df.empty:
-            merged_df = temp_df
-        else:
-            merged_df = pd.merge(merged_df, temp_df, on='date', how='outer')
+def load_report_file_qc(path):
+    # 읽은 스레드에서 바로 품질 지표까지 계산한다 (데이터를 다시 읽지 않음)
+    df = load_report_file(path)
+    return df, unit_quality(df)
 
-    if merged_df.empty:
+def file_label(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+def load_report_files(file_paths, on_loaded=None, workers=DEFAULT_LOAD_WORKERS, loader=load_report_file):
+    """
+    보고서 파일들을 스레드 풀에서 동시에 읽는다. loader(path) 로 읽은 결과를 돌려준다.
+    on_loaded(완료 개수, 라벨, 예외 또는 None) 는 파일 하나를 다 읽을 때마다 (끝난 순서대로) 불린다.
+    반환: [(라벨, DataFrame 또는 None, 예외 또는 None)] — 완료 순서와 관계없이 file_paths 순서
+    """
+    results = [None] * len(file_paths)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(loader, path): i for i, path in enumerate(file_paths)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            label = file_label(file_paths[i])
+            try:
+                results[i] = (label, future.result(), None)
+            except Exception as e:
+                results[i] = (label, None, e)
+            if on_loaded:
+                on_loaded(done, label, results[i][2])
+    return results
+
+def build_long_frame(dfs):
+    # 파일마다 date 중복을 한 번만 제거하고 (date, 파일 번호, 센서...) 긴 프레임 하나로 합친다
+    parts = [df.drop_duplicates('date').assign(file_no=i) for i, df in enumerate(dfs) if 'date' in df.columns]
+    if not parts:
         return pd.DataFrame()
+    return pd.concat(parts, ignore_index=True).set_index(['date', 'file_no'])
 
-    merged_df = merged_df.dropna(subset=['date'])
-    merged_df['Date'] = merged_df['date'].dt.strftime('%Y-%m-%d')
-    merged_df['Time'] = merged_df['date'].dt.strftime('%H:%M:%S')
-    merged_df = merged_df.drop(columns=['date'])
-    return merged_df[['Date', 'Time'] + valid_labels]
+def prepare_sensor_sheets(dfs, file_labels, sensor_columns):
+    """
+    센서별 시트(Date, Time, 파일별 값)를 만든다. 모든 파일을 긴 프레임으로 합친 뒤 unstack 한 번으로 펼친다.
+    시트에는 그 센서 컬럼이 있는 파일만 들어가고, 행은 그 파일들의 date 합집합(시간순)이다.
+    반환: {센서: 시트} (sensor_columns 순서, 빈 시트 제외)
+    """
+    long_df = build_long_frame(dfs)
+    if long_df.empty:
+        return {}
 
-def get_ordered_sensors(dfs):
+    sensors = [sensor for sensor in sensor_columns if sensor in long_df.columns]
+    wide = long_df[sensors].unstack('file_no')
+    present = pd.Series(True, index=long_df.index).unstack('file_no', fill_value=False)
+    dates = wide.index.strftime('%Y-%m-%d')
+    times = wide.index.strftime('%H:%M:%S')
+
+    sheets = {}
+    for sensor in sensors:
+        files = [i for i, df in enumerate(dfs) if sensor in df.columns and 'date' in df.columns]
+        rows = present.reindex(columns=files, fill_value=False).any(axis=1).to_numpy()
+        if not rows.any():
+            continue
+        values = wide[sensor].reindex(columns=files).to_numpy()[rows]
+        sheet = pd.DataFrame(values, columns=[file_labels[i] for i in files])
+        sheet.insert(0, 'Date', dates[rows])
+        sheet.insert(1, 'Time', times[rows])
+        sheets[sensor] = sheet
+    return sheets
+
+def order_sensor_columns(column_lists):
     priority_order = ['pm2.5', 'pm10', 'temp', 'humi', 'hcho', 'noise', 'co2', 'co', 'vocs', 'no2']
-    all_sensors = {col for df in dfs for col in df.columns if col != 'date'}
+    all_sensors = {col for columns in column_lists for col in columns if col != 'date'}
     ordered = [s for s in priority_order if s in all_sensors]
     remaining = sorted(all_sensors - set(ordered))
     return ordered + remaining
 
+def resample_long_frame(long_df, freq):
+    # (date, file_no) 긴 프레임을 freq 구간으로 내림한 뒤 groupby 한 번으로 유닛/센서별 평균/최소/최대/개수를 구한다
+    values = long_df.apply(pd.to_numeric, errors='coerce') if not all(
+        pd.api.types.is_numeric_dtype(dtype) for dtype in long_df.dtypes) else long_df
+    buckets = long_df.index.get_level_values('date').floor(freq)
+    file_no = long_df.index.get_level_values('file_no')
+    return values.groupby([buckets.rename('date'), file_no]).agg(RESAMPLE_AGGREGATES)
+
+def _select_columns(wide, columns):
+    # (센서, 값, 파일 번호) 목록 순서대로 컬럼을 뽑는다. 없는 조합은 빈 값.
+    if not columns:
+        return wide.iloc[:, :0].to_numpy()
+    return wide.reindex(columns=pd.MultiIndex.from_tuples(columns, names=wide.columns.names)).to_numpy()
+
+def prepare_resampled_sheets(dfs, file_labels, sensor_columns, freq):
+    """
+    시간 집계 보고서 시트를 만든다 (freq: '1h', '1D' 등 pandas 주기).
+    센서 시트는 Date, Time(구간 시작), 파일마다 "<라벨> mean/min/max/count" 컬럼,
+    유닛 시트는 date 와 센서마다 "<센서> mean/min/max/count" 컬럼이다. 행은 prepare_sensor_sheets 와 같은 규칙.
+    반환: ({센서: 시트}, [유닛 시트]) — 유닛 시트는 dfs 순서 (date 가 없는 파일은 원본 그대로)
+    """
+    long_df = build_long_frame(dfs)
+    if long_df.empty:
+        return {}, list(dfs)
+
+    sensors = [sensor for sensor in sensor_columns if sensor in long_df.columns]
+    agg = resample_long_frame(long_df[sensors], freq)
+    wide = agg.unstack('file_no')
+    present = pd.Series(True, index=agg.index).unstack('file_no', fill_value=False)
+    dates = wide.index.strftime('%Y-%m-%d')
+    times = wide.index.strftime('%H:%M:%S')
+
+    sensor_sheets = {}
+    for sensor in sensors:
+        files = [i for i, df in enumerate(dfs) if sensor in df.columns and 'date' in df.columns]
+        rows = present.reindex(columns=files, fill_value=False).any(axis=1).to_numpy()
+        if not rows.any():
+            continue
+        columns = [(sensor, stat, i) for i in files for stat in RESAMPLE_AGGREGATES]
+        sheet = pd.DataFrame(_select_columns(wide, columns)[rows],
+                             columns=[f"{file_labels[i]} {stat}" for _, stat, i in columns])
+        sheet.insert(0, 'Date', dates[rows])
+        sheet.insert(1, 'Time', times[rows])
+        sensor_sheets[sensor] = sheet
+
+    unit_sheets = []
+    for i, df in enumerate(dfs):
+        if 'date' not in df.columns or i not in present.columns:
+            unit_sheets.append(df)
+            continue
+        rows = present[i].to_numpy()
+        columns = [(sensor, stat, i) for sensor in df.columns if sensor in sensors for stat in RESAMPLE_AGGREGATES]
+        sheet = pd.DataFrame(_select_columns(wide, columns)[rows],
+                             columns=[f"{sensor} {stat}" for sensor, stat, _ in columns])
+        sheet.insert(0, 'date', wide.index[rows])
+        unit_sheets.append(sheet)
+    return sensor_sheets, unit_sheets
+
+def get_ordered_sensors(dfs):
+    return order_sensor_columns(df.columns for df in dfs)
+
 def prepare_summary_sheet(dfs, file_labels):
     summary_rows = []
 
@@ -53,47 +184,266 @@ def prepare_summary_sheet(dfs, file_labels):
         avg_row['SN'] = label
         summary_rows.append(avg_row)
 
+    return summary_frame(summary_rows)
+
+def summary_from_means(column_lists, means, file_labels):
+    # 파일별 평균 {컬럼: 값} 으로 prepare_summary_sheet 와 같은 요약 시트를 만든다
+    summary_rows = []
+    for columns, file_means, label in zip(column_lists, means, file_labels):
+        numeric_cols = [col for col in columns if col != 'date']
+        if not numeric_cols:
+            continue
+        avg_row = pd.Series({col: file_means[col] for col in numeric_cols if col in file_means},
+                            dtype='float64').round(1)
+        avg_row['SN'] = label
+        summary_rows.append(avg_row)
+    return summary_frame(summary_rows)
+
+def write_quality_sheet(writer, quality_name, quality_rows, file_labels):
+    quality_df = quality_frame(quality_rows, file_labels)
+    if not quality_df.empty:
+        writer.write_sheet(quality_name, quality_df)
+
+def summary_frame(summary_rows):
     if summary_rows:
         summary_df = pd.DataFrame(summary_rows)
         cols = ['SN'] + [col for col in summary_df.columns if col != 'SN']
         return summary_df[cols]
     return pd.DataFrame()
 
-def merge_and_save_aircok_files(file_paths, output_file, update_callback=None):
-    dfs, file_labels = [], []
+def oversized_sheets(sheets, writer_mode):
+    # Excel 로 저장할 때 행 제한을 넘어 이어지는 시트로 나뉠 시트 이름 목록
+    if writer_mode not in ("streaming", "openpyxl"):
+        return []
+    return [name for name, df in sheets.items() if len(df) > EXCEL_MAX_ROWS - 1]
 
-    for i, file in enumerate(file_paths):
-        try:
-            df = pd.read_csv(file)
-            df = format_date_columns(df)
+def write_low_memory_report(file_paths, headers, file_labels, writer, summary_name, quality_name, on_step=None,
+                            writer_mode=DEFAULT_WRITER_MODE, load_workers=DEFAULT_LOAD_WORKERS):
+    """
+    저메모리 보고서: 파일 전체를 한꺼번에 들고 있지 않고 시트마다 필요한 컬럼만 읽어 쓴다.
+    1) 센서마다 그 센서가 있는 파일에서 date 와 센서 컬럼만 읽어 센서 시트를 쓰고, 평균과 품질 지표를 모아 둔다.
+    2) 모은 값으로 요약/품질 시트를 쓴다.  3) 원본 시트는 파일을 하나씩 읽어 쓴다.
+    headers 는 파일별 컬럼 목록. 결과 시트는 일반 모드와 같다.
+    on_step(메시지, 단계 번호, 전체 단계 수) 는 시트를 하나 쓸 때마다 불린다 (단계 수는 센서 수 + 1 + 파일 수).
+    """
+    sensor_columns = order_sensor_columns(headers)
+    means = [{} for _ in file_paths]
+    quality = [{} for _ in file_paths]
+    step, num_steps = 0, len(sensor_columns) + 1 + len(file_paths)
+
+    def notify(message):
+        if on_step:
+            on_step(message, step, num_steps)
+
+    for sensor in sensor_columns:
+        files = [i for i, columns in enumerate(headers) if sensor in columns and 'date' in columns]
+        results = load_report_files([file_paths[i] for i in files], workers=load_workers,
+                                    loader=lambda path: read_report_columns(path, ['date', sensor]))
+        dfs = []
+        for i, (_, df, error) in zip(files, results):
+            if error is not None:
+                raise error
+            if pd.api.types.is_numeric_dtype(df[sensor]):
+                means[i][sensor] = df[sensor].mean()
+            for row in unit_quality(df):
+                quality[i][sensor] = row
             dfs.append(df)
-            label = os.path.splitext(os.path.basename(file))[0]
+        # date 가 없는 파일은 시트에는 빠지지만 평균에는 들어간다
+        for i, columns in enumerate(headers):
+            if sensor in columns and 'date' not in columns:
+                df = read_report_columns(file_paths[i], [sensor])
+                if pd.api.types.is_numeric_dtype(df[sensor]):
+                    means[i][sensor] = df[sensor].mean()
+
+        sheet = prepare_sensor_sheets(dfs, [file_labels[i] for i in files], [sensor]).get(sensor)
+        del dfs, results
+        if sheet is not None:
+            if oversized_sheets({sensor: sheet}, writer_mode):
+                notify(f"Excel 행 제한 초과, 이어지는 시트로 나눔: {sensor}")
+            writer.write_sheet(sensor[:31], sheet)
+        del sheet
+        notify(f"센서 시트 생성: {sensor}")
+        step += 1
+
+    summary_df = summary_from_means(headers, means, file_labels)
+    if not summary_df.empty:
+        writer.write_sheet(summary_name, summary_df)
+        notify(f"요약 시트 생성: {summary_name}")
+    quality_rows = [[file_quality[col] for col in columns if col in file_quality]
+                    for columns, file_quality in zip(headers, quality)]
+    write_quality_sheet(writer, quality_name, quality_rows, file_labels)
+    step += 1
+
+    for path, label in zip(file_paths, file_labels):
+        writer.write_sheet(label[:31], read_report_columns(path))
+        notify(f"원본 시트 저장: {label}")
+        step += 1
+
+def partial_path(output_file):
+    base, ext = os.path.splitext(output_file)
+    return f"{base}.partial{ext}"
+
+def update_aircok_report(file_paths, output_file, summary_name, quality_name, writer_mode=DEFAULT_WRITER_MODE,
+                         on_loaded=None, on_step=None, load_workers=DEFAULT_LOAD_WORKERS, skip_failed=False):
+    """
+    증분 보고서: "<보고서>.manifest.json" 기록과 비교해 새로 추가되거나 바뀐(크기/수정시각) 파일만 다시 읽는다.
+    - 바뀐 파일이 들어가는 센서 시트만 다시 만들고 (바뀌지 않은 파일은 date 와 그 센서 컬럼만 읽음)
+    - 요약/품질 시트는 기록해 둔 평균과 지표로 다시 쓰고, 바뀌지 않은 원본 시트는 이전 보고서에서 그대로 옮긴다.
+    기록이 없거나 맞지 않으면(저장 방식 변경, 보고서가 따로 바뀜 등) 전체를 만든다. 결과 시트는 일반 모드와 같다.
+    Excel / CSV 묶음은 새 파일에 쓴 뒤 바꿔 끼우고, Parquet 폴더는 바뀐 시트 파일만 다시 쓴다.
+    on_loaded 는 load_report_files, on_step 은 write_low_memory_report 와 같다. 반환: 다시 읽은 파일 수
+    """
+    manifest = load_report_manifest(output_file, writer_mode, summary_name)
+    previous = {unit["path"]: unit for unit in manifest["units"]} if manifest else {}
+    changed = [i for i, path in enumerate(file_paths)
+               if not is_unchanged(previous.get(os.path.abspath(path), {}), path)]
+    loaded = dict(zip(changed, load_report_files([file_paths[i] for i in changed], on_loaded, load_workers,
+                                                 loader=load_report_file_qc)))
+
+    paths, file_labels, records, dfs = [], [], [], {}
+    for i, path in enumerate(file_paths):
+        if i in loaded:
+            label, result, error = loaded[i]
+            if error is not None:
+                if skip_failed:
+                    continue
+                raise error
+            df, quality = result
+            dfs[len(paths)] = df
+            records.append(unit_record(path, label, df, quality))
+        else:
+            label = file_label(path)
+            records.append(previous[os.path.abspath(path)])
+        paths.append(path)
+        file_labels.append(label)
+
+    headers = [record["columns"] for record in records]
+    sensor_columns = order_sensor_columns(headers)
+    source = output_file if manifest else None
+    target = output_file if writer_mode == "parquet" else partial_path(output_file)
+    step, num_steps = 0, len(sensor_columns) + 1 + len(paths)
+
+    def notify(message):
+        if on_step:
+            on_step(message, step, num_steps)
+
+    def sheet_files(units, sensor):
+        return [unit["path"] for unit in units if sensor in unit["columns"] and 'date' in unit["columns"]]
+
+    try:
+        with open_report_writer(target, writer_mode) as writer:
+            for sensor in sensor_columns:
+                files = [i for i, columns in enumerate(headers) if sensor in columns and 'date' in columns]
+                if (source and not any(i in dfs for i in files)
+                        and sheet_files(manifest["units"], sensor) == sheet_files(records, sensor)):
+                    writer.copy_sheet(sensor[:31], source)
+                    notify(f"센서 시트 유지: {sensor}")
+                else:
+                    unchanged = [i for i in files if i not in dfs]
+                    results = load_report_files([paths[i] for i in unchanged], workers=load_workers,
+                                                loader=lambda path: read_report_columns(path, ['date', sensor]))
+                    columns = dict(zip(unchanged, results))
+                    for i in unchanged:
+                        if columns[i][2] is not None:
+                            raise columns[i][2]
+                    sensor_dfs = [dfs[i] if i in dfs else columns[i][1] for i in files]
+                    sheet = prepare_sensor_sheets(sensor_dfs, [file_labels[i] for i in files], [sensor]).get(sensor)
+                    del sensor_dfs, columns, results
+                    if sheet is not None:
+                        if oversized_sheets({sensor: sheet}, writer_mode):
+                            notify(f"Excel 행 제한 초과, 이어지는 시트로 나눔: {sensor}")
+                        writer.write_sheet(sensor[:31], sheet)
+                    del sheet
+                    notify(f"센서 시트 생성: {sensor}")
+                step += 1
+
+            summary_df = summary_from_means(headers, [record["means"] for record in records], file_labels)
+            if not summary_df.empty:
+                writer.write_sheet(summary_name, summary_df)
+                notify(f"요약 시트 생성: {summary_name}")
+            write_quality_sheet(writer, quality_name, [record["quality"] for record in records], file_labels)
+            step += 1
+
+            for i, label in enumerate(file_labels):
+                if i in dfs:
+                    writer.write_sheet(label[:31], dfs[i])
+                    notify(f"원본 시트 저장: {label}")
+                else:
+                    writer.copy_sheet(label[:31], source)
+                    notify(f"원본 시트 유지: {label}")
+                step += 1
+    except Exception:
+        # 이전 보고서는 그대로 두고 쓰다 만 파일만 지운다
+        if target != output_file and os.path.exists(target):
+            os.remove(target)
+        raise
+
+    if writer_mode == "parquet":
+        writer.prune()
+    else:
+        os.replace(target, output_file)
+    save_report_manifest(output_file, writer_mode, summary_name, records)
+    return len(dfs)
+
+def merge_and_save_aircok_files(file_paths, output_file, update_callback=None, writer_mode=DEFAULT_WRITER_MODE,
+                                load_workers=DEFAULT_LOAD_WORKERS, low_memory=False, incremental=False, resample=None):
+    def on_loaded(done, label, error):
+        if update_callback:
+            update_callback(f"파일 로드 실패: {label} ({error})" if error else f"파일 로드: {label}", done - 1)
+
+    def on_step(message, step, num_steps):
+        if update_callback:
+            update_callback(message, len(file_paths) + step)
+
+    # 시간 집계 보고서는 항상 전체를 읽어 한 번에 집계한다
+    if incremental and not resample:
+        update_aircok_report(file_paths, output_file, 'Summary_by_SN', 'QC_by_SN', writer_mode, on_loaded, on_step,
+                             load_workers, skip_failed=True)
+        return
+
+    if low_memory and not resample:
+        loaded = load_report_files(file_paths, on_loaded, load_workers, loader=read_table_columns)
+        ok = [(path, label, columns) for path, (label, columns, error) in zip(file_paths, loaded) if error is None]
+        paths, file_labels, headers = (list(x) for x in zip(*ok)) if ok else ([], [], [])
+
+        with open_report_writer(output_file, writer_mode) as writer:
+            write_low_memory_report(paths, headers, file_labels, writer, 'Summary_by_SN', 'QC_by_SN', on_step,
+                                    writer_mode, load_workers)
+        return
+
+    dfs, quality_rows, file_labels = [], [], []
+    for label, result, error in load_report_files(file_paths, on_loaded, load_workers, loader=load_report_file_qc):
+        if error is None:
+            dfs.append(result[0])
+            quality_rows.append(result[1])
             file_labels.append(label)
-            if update_callback:
-                update_callback(f"파일 로드: {label}", i)
-        except Exception as e:
-            if update_callback:
-                update_callback(f"파일 로드 실패: {file} ({e})", i)
-            continue
 
     sensor_columns = get_ordered_sensors(dfs)
+    if resample:
+        sensor_sheets, unit_sheets = prepare_resampled_sheets(dfs, file_labels, sensor_columns, resample)
+    else:
+        sensor_sheets, unit_sheets = prepare_sensor_sheets(dfs, file_labels, sensor_columns), dfs
+    split = oversized_sheets({**sensor_sheets, **dict(zip(file_labels, unit_sheets))}, writer_mode)
+    if split and update_callback:
+        update_callback(f"Excel 행 제한 초과, 이어지는 시트로 나눔: {', '.join(split)}", len(file_paths))
 
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+    with open_report_writer(output_file, writer_mode) as writer:
         for idx, sensor in enumerate(sensor_columns):
-            sensor_df = prepare_simple_sheet(sensor, dfs, file_labels)
-            if not sensor_df.empty:
-                sensor_df.to_excel(writer, sheet_name=sensor[:31], index=False)
+            sensor_df = sensor_sheets.get(sensor)
+            if sensor_df is not None:
+                writer.write_sheet(sensor[:31], sensor_df)
             if update_callback:
                 update_callback(f"센서 시트 생성: {sensor}", len(file_paths) + idx)
 
         summary_df = prepare_summary_sheet(dfs, file_labels)
         if not summary_df.empty:
-            summary_df.to_excel(writer, sheet_name='Summary_by_SN', index=False)
+            writer.write_sheet('Summary_by_SN', summary_df)
             if update_callback:
                 update_callback("요약 시트 생성: Summary_by_SN", len(file_paths) + len(sensor_columns))
+        write_quality_sheet(writer, 'QC_by_SN', quality_rows, file_labels)
 
-        for i, (df, label) in enumerate(zip(dfs, file_labels)):
-            df.to_excel(writer, sheet_name=label[:31], index=False)
+        for i, (df, label) in enumerate(zip(unit_sheets, file_labels)):
+            writer.write_sheet(label[:31], df)
             if update_callback:
                 update_callback(f"원본 시트 저장: {label}", len(file_paths) + len(sensor_columns) + i)
 
@@ -102,13 +452,27 @@ class ReportGeneratorThread(QThread):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, aircok_files, output_file):
+    def __init__(self, aircok_files, output_file, writer_mode=DEFAULT_WRITER_MODE, load_workers=DEFAULT_LOAD_WORKERS,
+                 low_memory=False, incremental=False, resample=None):
         super().__init__()
         self.aircok_files = aircok_files
         self.output_file = output_file
+        self.writer_mode = writer_mode
+        self.load_workers = load_workers
+        self.low_memory = low_memory
+        self.incremental = incremental
+        self.resample = resample
 
     def run(self):
         try:
+            # 시간 집계 보고서는 항상 전체를 읽어 한 번에 집계한다
+            if self.incremental and not self.resample:
+                self._run_incremental()
+                return
+            if self.low_memory and not self.resample:
+                self._run_low_memory()
+                return
+
             dfs = []
             file_labels = []
             num_files = len(self.aircok_files)
@@ -118,33 +482,46 @@ class ReportGeneratorThread(QThread):
             summary_sheet_weight = 0.1
             original_sheet_weight = 0.29
 
-            for i, file in enumerate(self.aircok_files):
-                df = pd.read_csv(file)
-                df = format_date_columns(df)
-                dfs.append(df)
-                label = os.path.splitext(os.path.basename(file))[0]
+            def on_loaded(done, label, error):
+                percent = int(done / num_files * file_load_weight * 100)
+                self._emit_progress(f"파일 로드 실패: {label}" if error else f"파일 로드: {label}", percent)
+
+            quality_rows = []
+            for label, result, error in load_report_files(self.aircok_files, on_loaded, self.load_workers,
+                                                          loader=load_report_file_qc):
+                if error is not None:
+                    raise error
+                dfs.append(result[0])
+                quality_rows.append(result[1])
                 file_labels.append(label)
-                percent = int((i + 1) / num_files * file_load_weight * 100)
-                self._emit_progress(f"파일 로드: {label}", percent)
 
             sensor_columns = get_ordered_sensors(dfs)
             num_sensors = len(sensor_columns)
+            if self.resample:
+                sensor_sheets, unit_sheets = prepare_resampled_sheets(dfs, file_labels, sensor_columns, self.resample)
+            else:
+                sensor_sheets, unit_sheets = prepare_sensor_sheets(dfs, file_labels, sensor_columns), dfs
+            split = oversized_sheets({**sensor_sheets, **dict(zip(file_labels, unit_sheets))}, self.writer_mode)
+            if split:
+                self._emit_progress(f"Excel 행 제한 초과, 이어지는 시트로 나눔: {', '.join(split)}",
+                                    int(file_load_weight * 100))
 
-            with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
+            with open_report_writer(self.output_file, self.writer_mode) as writer:
                 for idx, sensor in enumerate(sensor_columns):
-                    sensor_df = prepare_simple_sheet(sensor, dfs, file_labels)
-                    if not sensor_df.empty:
-                        sensor_df.to_excel(writer, sheet_name=sensor[:31], index=False)
+                    sensor_df = sensor_sheets.get(sensor)
+                    if sensor_df is not None:
+                        writer.write_sheet(sensor[:31], sensor_df)
                     percent = int(file_load_weight * 100 + (idx + 1) / num_sensors * sensor_sheet_weight * 100)
                     self._emit_progress(f"센서 시트 생성: {sensor}", percent)
 
                 summary_df = prepare_summary_sheet(dfs, file_labels)
                 if not summary_df.empty:
-                    summary_df.to_excel(writer, sheet_name='센서 평균', index=False)
+                    writer.write_sheet('센서 평균', summary_df)
                     self._emit_progress("평균 생성", int(file_load_weight * 100 + sensor_sheet_weight * 100 + summary_sheet_weight * 100))
+                write_quality_sheet(writer, '데이터 품질', quality_rows, file_labels)
 
-                for i, (df, label) in enumerate(zip(dfs, file_labels)):
-                    df.to_excel(writer, sheet_name=label[:31], index=False)
+                for i, (df, label) in enumerate(zip(unit_sheets, file_labels)):
+                    writer.write_sheet(label[:31], df)
                     percent = int(file_load_weight * 100 + sensor_sheet_weight * 100 + summary_sheet_weight * 100 +
                                   (i + 1) / num_files * original_sheet_weight * 100)
                     self._emit_progress(f"원본 시트 저장: {label}", percent)
@@ -155,5 +532,48 @@ class ReportGeneratorThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+    def _run_incremental(self):
+        # 바뀐 파일 로드까지를 파일 로드 구간, 나머지를 시트 단위로 나눈다
+        num_files = len(self.aircok_files)
+        load_weight = 0.3
+
+        def on_loaded(done, label, error):
+            self._emit_progress(f"파일 로드 실패: {label}" if error else f"파일 로드: {label}",
+                                int(done / num_files * load_weight * 100))
+
+        def on_step(message, step, num_steps):
+            self._emit_progress(message, int(load_weight * 100 + (step + 1) / num_steps * (99 - load_weight * 100)))
+
+        reloaded = update_aircok_report(self.aircok_files, self.output_file, '센서 평균', '데이터 품질',
+                                        self.writer_mode, on_loaded, on_step, self.load_workers)
+        self._emit_progress(f"완료 (다시 읽은 파일 {reloaded}/{num_files})", 100)
+        self.finished.emit(self.output_file)
+
+    def _run_low_memory(self):
+        # 컬럼 목록만 먼저 읽고(짧음) 나머지 진행률은 시트 단위로 나눈다
+        num_files = len(self.aircok_files)
+        header_weight = 0.05
+
+        def on_loaded(done, label, error):
+            self._emit_progress(f"파일 확인 실패: {label}" if error else f"파일 확인: {label}",
+                                int(done / num_files * header_weight * 100))
+
+        loaded = load_report_files(self.aircok_files, on_loaded, self.load_workers, loader=read_table_columns)
+        for _, _, error in loaded:
+            if error is not None:
+                raise error
+        file_labels = [label for label, _, _ in loaded]
+        headers = [columns for _, columns, _ in loaded]
+
+        def on_step(message, step, num_steps):
+            self._emit_progress(message, int(header_weight * 100 + (step + 1) / num_steps * (99 - header_weight * 100)))
+
+        with open_report_writer(self.output_file, self.writer_mode) as writer:
+            write_low_memory_report(self.aircok_files, headers, file_labels, writer, '센서 평균', '데이터 품질',
+                                    on_step, self.writer_mode, self.load_workers)
+
+        self._emit_progress("완료", 100)
+        self.finished.emit(self.output_file)
+
     def _emit_progress(self, status_text, step_index):
         self.progress.emit(status_text, step_index)
@@ -1,6 +1,7 @@
 import os
 from openpyxl import Workbook
-from openpyxl.styles import Font, Border, Side, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Border, Side, Alignment, NamedStyle
 
 
 def to_float_safe(value):
@@ -10,27 +11,13 @@ def to_float_safe(value):
         return 0.0
 
 
-def generate_calibration_report(results: dict, output_file: str):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "보정값"
+HEADERS = ["SN", "pm2.5", "pm10", "temp", "humi", "co2"]
+HEADER_STYLE = "calibration_header"
+CELL_STYLE = "calibration_cell"
 
-    headers = ["SN", "pm2.5", "pm10", "temp", "humi", "co2"]
-    ws.append(headers)
-
-    bold_font = Font(bold=True)
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
-    center_align = Alignment(horizontal='center', vertical='center')
-
-    # 헤더 셀 스타일 적용
-    for cell in ws[1]:
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = center_align
 
+def calibration_rows(results: dict):
+    # 유닛마다 [SN/보정식, 보정 전, 보정 후, 빈 줄] 네 줄 (빈 줄은 [])
     for file_path, result in results.items():
         sn = os.path.splitext(os.path.basename(file_path))[0]
 
@@ -45,10 +32,9 @@ def generate_calibration_report(results: dict, output_file: str):
 
         co2_corr = result.get("co2_correction_str", "")
 
-        row_header = [sn, pm25_formula, pm10_formula, temp_corr, humi_corr, co2_corr]
-        ws.append(row_header)
+        yield [sn, pm25_formula, pm10_formula, temp_corr, humi_corr, co2_corr]
 
-        row_pre = [
+        yield [
             "보정 전",
             f"{to_float_safe(result.get('pm25_accuracy_pre')):.0f}%",
             f"{to_float_safe(result.get('pm10_accuracy_pre')):.0f}%",
@@ -56,9 +42,8 @@ def generate_calibration_report(results: dict, output_file: str):
             f"{to_float_safe(result.get('humi_accuracy')):.0f}%",
             f"{to_float_safe(result.get('pre_correction_accuracy')):.0f}%"
         ]
-        ws.append(row_pre)
 
-        row_post = [
+        yield [
             "보정 후",
             f"{to_float_safe(result.get('pm25_accuracy_post')):.0f}%",
             f"{to_float_safe(result.get('pm10_accuracy_post')):.0f}%",
@@ -66,9 +51,79 @@ def generate_calibration_report(results: dict, output_file: str):
             f"{to_float_safe(result.get('humi_corrected_accuracy')):.0f}%",
             f"{to_float_safe(result.get('post_correction_accuracy')):.0f}%"
         ]
-        ws.append(row_post)
 
-        ws.append([])
+        yield []
+
+
+def _styles():
+    thin_border = Border(
+        left=Side(style='thin'), right=Side(style='thin'),
+        top=Side(style='thin'), bottom=Side(style='thin')
+    )
+    center_align = Alignment(horizontal='center', vertical='center')
+    return Font(bold=True), thin_border, center_align
+
+
+def generate_calibration_report(results: dict, output_file: str, write_only: bool = True):
+    """
+    보정 결과를 "보정값" 시트로 저장한다. load_previous_calibration 이 다시 읽으므로 시트 모양을 바꾸지 않는다.
+    write_only 이면 행을 바로 흘려 쓰고 셀 스타일은 이름 붙인 스타일 두 개를 공유한다 (유닛이 많을 때 빠름).
+    """
+    if not write_only:
+        return _generate_calibration_report_cells(results, output_file)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("보정값")
+    bold_font, thin_border, center_align = _styles()
+    wb.add_named_style(NamedStyle(name=HEADER_STYLE, font=bold_font, border=thin_border, alignment=center_align))
+    wb.add_named_style(NamedStyle(name=CELL_STYLE, alignment=center_align))
+
+    # write-only 시트는 append 할 때 바로 기록하므로, 스타일을 지정한 셀 한 줄을 만들어 두고 값만 바꿔 재사용한다
+    def styled_row(style):
+        cells = [WriteOnlyCell(ws) for _ in HEADERS]
+        for cell in cells:
+            cell.style = style
+        return cells
+
+    def fill(cells, values):
+        for cell, value in zip(cells, values):
+            cell.value = value
+        return cells
+
+    header_cells, body_cells = styled_row(HEADER_STYLE), styled_row(CELL_STYLE)
+    ws.append(fill(header_cells, HEADERS))
+    # 기존 방식처럼 유닛 사이 빈 줄도 가운데 정렬된 빈 셀로 채우고, 마지막 빈 줄은 쓰지 않는다
+    pending_blank = False
+    for row in calibration_rows(results):
+        if not row:
+            pending_blank = True
+            continue
+        if pending_blank:
+            ws.append(fill(body_cells, [None] * len(HEADERS)))
+            pending_blank = False
+        ws.append(fill(body_cells, row))
+
+    wb.save(output_file)
+
+
+def _generate_calibration_report_cells(results: dict, output_file: str):
+    # 기존 방식: 일반 통합 문서에 셀을 모두 만든 뒤 스타일을 하나씩 지정한다
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "보정값"
+
+    ws.append(HEADERS)
+
+    bold_font, thin_border, center_align = _styles()
+
+    # 헤더 셀 스타일 적용
+    for cell in ws[1]:
+        cell.font = bold_font
+        cell.border = thin_border
+        cell.alignment = center_align
+
+    for row in calibration_rows(results):
+        ws.append(row)
 
     for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
         for cell in row:
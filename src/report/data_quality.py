@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+# 데이터 품질(QC) 시트: 유닛/센서마다 커버리지, 최장 공백, 같은 값 연속, 스파이크 수
+QC_INTERVAL = np.timedelta64(5, 'm')  # 기대 측정 간격
+SPIKE_Z = 6.0  # 앞뒤 변화량이 모두 이 robust z 보다 크고 방향이 반대이면 스파이크
+QC_COLUMNS = ['SN', 'sensor', 'start', 'end', 'samples', 'coverage_%', 'longest_gap_min', 'flat_run', 'spikes']
+
+
+def unit_quality(df):
+    """
+    파일 하나(date + 센서 컬럼)의 품질 지표를 센서마다 한 행씩 계산한다. 이미 읽은 DataFrame 만 쓴다.
+    - coverage_%: 유닛의 첫~마지막 시각 사이 5분 격자 중 값이 있는 칸의 비율
+    - longest_gap_min: 값이 없는 가장 긴 구간(분), 기간 앞뒤 포함
+    - flat_run: 같은 값이 연속된 최대 측정 수 (센서 멈춤)
+    - spikes: 한 측정만 튀었다 돌아오는 횟수
+    반환: [{sensor, start, end, ...}] — 컬럼 순서
+    """
+    sensors = [col for col in df.columns if col != 'date' and pd.api.types.is_numeric_dtype(df[col])]
+    if 'date' not in df.columns or not sensors or df.empty:
+        return []
+
+    # 시트와 같은 기준으로 본다: 같은 시각이 여러 번 기록되면 처음 것만 남긴다
+    df = df.drop_duplicates('date')
+    order = np.argsort(df['date'].to_numpy(), kind='stable')
+    dates = df['date'].to_numpy().astype('datetime64[ns]')[order]
+    start, end = dates[0], dates[-1]
+    slots = (dates - start) // QC_INTERVAL
+    expected = int(slots[-1]) + 1
+    edges_before, edges_after = np.array([start - QC_INTERVAL]), np.array([end + QC_INTERVAL])
+
+    rows = []
+    for sensor in sensors:
+        values = df[sensor].to_numpy(dtype='float64')[order]
+        valid = ~np.isnan(values)
+        times, v = dates[valid], values[valid]
+
+        gaps = np.diff(np.concatenate([edges_before, times, edges_after])) - QC_INTERVAL
+        longest_gap = max(gaps.max() / np.timedelta64(1, 'm'), 0.0)
+
+        flat_run = 0
+        if len(v):
+            changes = np.flatnonzero(v[1:] != v[:-1]) + 1
+            flat_run = int(np.diff(np.concatenate([[0], changes, [len(v)]])).max())
+
+        spikes = 0
+        diffs = np.diff(v)
+        if len(diffs) >= 2:
+            deviation = np.abs(diffs - np.median(diffs))
+            scale = 1.4826 * np.median(deviation) or diffs.std()
+            if scale > 0:
+                jump = deviation / scale > SPIKE_Z
+                spikes = int(np.count_nonzero(jump[:-1] & jump[1:] & (np.sign(diffs[:-1]) != np.sign(diffs[1:]))))
+
+        rows.append({
+            'sensor': sensor,
+            'start': pd.Timestamp(start).strftime('%Y-%m-%d %H:%M:%S'),
+            'end': pd.Timestamp(end).strftime('%Y-%m-%d %H:%M:%S'),
+            'samples': int(valid.sum()),
+            'coverage_%': round(len(np.unique(slots[valid])) / expected * 100, 1),
+            'longest_gap_min': round(float(longest_gap), 1),
+            'flat_run': flat_run,
+            'spikes': spikes,
+        })
+    return rows
+
+
+def quality_frame(unit_rows, file_labels):
+    # 유닛별 unit_quality 결과를 SN 을 붙여 한 시트로 모은다
+    rows = [{'SN': label, **row} for qc, label in zip(unit_rows, file_labels) for row in qc]
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows, columns=QC_COLUMNS)
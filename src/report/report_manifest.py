@@ -0,0 +1,84 @@
+import json
+import os
+import pandas as pd
+
+# 보고서 증분 갱신 기록: "<보고서>.manifest.json" 에 어떤 파일(크기, 수정시각, 기간, 컬럼, 평균, 품질 지표)로 만들었는지 남긴다
+REPORT_MANIFEST_VERSION = 2
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def manifest_path(output_file):
+    return os.path.normpath(output_file) + MANIFEST_SUFFIX
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def output_signature(path):
+    # 보고서가 기록 이후 바뀌었는지 확인용. Parquet 보고서는 폴더이므로 안의 파일 목록으로 본다.
+    if os.path.isdir(path):
+        return sorted([entry.name, *file_signature(entry.path).values()]
+                      for entry in os.scandir(path) if entry.is_file())
+    return list(file_signature(path).values())
+
+
+def unit_record(path, label, df, quality):
+    # 유닛(파일) 하나의 기록: 바뀌었는지 판단할 크기/수정시각, 기간, 컬럼 순서, 요약 시트용 평균, 품질 시트 행
+    numeric_cols = [col for col in df.columns if col != 'date']
+    means = df[numeric_cols].mean(numeric_only=True) if numeric_cols else pd.Series(dtype='float64')
+    has_dates = 'date' in df.columns and len(df) > 0
+    return {
+        "path": os.path.abspath(path),
+        "label": label,
+        **file_signature(path),
+        "columns": list(df.columns),
+        "rows": len(df),
+        "start": str(df['date'].min()) if has_dates else None,
+        "end": str(df['date'].max()) if has_dates else None,
+        "means": {col: float(value) for col, value in means.items()},
+        "quality": quality,
+    }
+
+
+def is_unchanged(record, path):
+    try:
+        return record["path"] == os.path.abspath(path) and {
+            "size": record["size"], "mtime_ns": record["mtime_ns"]} == file_signature(path)
+    except (OSError, KeyError):
+        return False
+
+
+def load_report_manifest(output_file, writer_mode, summary_name):
+    """
+    보고서 증분 기록을 읽는다. 저장 방식이나 요약 시트 이름이 다르거나,
+    보고서가 없거나 기록 이후 바뀌었으면 None 을 돌려 전체를 다시 만들게 한다.
+    """
+    try:
+        with open(manifest_path(output_file), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if (manifest.get("version") != REPORT_MANIFEST_VERSION
+                or manifest["writer_mode"] != writer_mode
+                or manifest["summary_name"] != summary_name
+                or manifest["output"] != output_signature(output_file)):
+            return None
+        return manifest
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_report_manifest(output_file, writer_mode, summary_name, units):
+    manifest = {
+        "version": REPORT_MANIFEST_VERSION,
+        "writer_mode": writer_mode,
+        "summary_name": summary_name,
+        "output": output_signature(output_file),
+        "units": units,
+    }
+    tmp_path = manifest_path(output_file) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path(output_file))
+    return manifest
+
@@ -0,0 +1,255 @@
+import datetime
+import io
+import os
+import re
+import shutil
+import zipfile
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+# 보고서 저장 방식: streaming 은 openpyxl write-only 로 행을 흘려 쓰고, openpyxl 은 기존 pd.ExcelWriter 경로.
+# csv-zip / parquet 는 Excel 로 다루기 어려운 큰 데이터를 위한 묶음 저장 (시트마다 파일 하나)
+WRITER_MODES = ("streaming", "openpyxl", "csv-zip", "parquet")
+DEFAULT_WRITER_MODE = "streaming"
+# 저장 대화상자 필터 → (확장자, 저장 방식)
+REPORT_FORMATS = {
+    "Excel 파일 (*.xlsx)": (".xlsx", DEFAULT_WRITER_MODE),
+    "CSV 묶음 (*.zip)": (".zip", "csv-zip"),
+    "Parquet 폴더 (*.parquet)": (".parquet", "parquet"),
+}
+DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"  # pandas 가 datetime 셀에 쓰는 표시 형식
+ROW_BLOCK = 10000  # 한 번에 파이썬 값으로 바꾸는 행 수
+EXCEL_MAX_ROWS = 1048576  # 머리글 포함 시트당 최대 행 수
+SHEET_NAME_LENGTH = 31
+INVALID_FILE_CHARS = re.compile(r'[\\/:*?"<>|]')
+
+
+def part_name(name, number):
+    # 나눈 시트의 이름: 첫 번째는 그대로, 두 번째부터 "이름 (2)", "이름 (3)" ... (31자 제한 안에서)
+    if number == 1:
+        return name[:SHEET_NAME_LENGTH]
+    suffix = f" ({number})"
+    return name[:SHEET_NAME_LENGTH - len(suffix)] + suffix
+
+
+def sheet_parts(name, num_rows, max_rows=EXCEL_MAX_ROWS - 1):
+    """
+    데이터 행이 max_rows 를 넘으면 이어지는 시트로 나눈다.
+    반환: [(시트 이름, 시작 행, 끝 행)]
+    """
+    return [(part_name(name, number), start, min(start + max_rows, num_rows))
+            for number, start in enumerate(range(0, max(num_rows, 1), max_rows), start=1)]
+
+
+def existing_parts(sheet_names, name):
+    # 이전 통합 문서에서 name 시트와 이어지는 시트 이름들
+    parts = []
+    while part_name(name, len(parts) + 1) in sheet_names:
+        parts.append(part_name(name, len(parts) + 1))
+    return parts
+
+
+def _pandas_styles_header():
+    # pandas 2.x 는 머리글을 굵게/테두리/가운데 정렬로 쓰고, 3.0 부터는 스타일 없이 쓴다. 같은 모양이 되도록 따른다.
+    try:
+        from pandas.io.formats.excel import ExcelFormatter
+        return hasattr(ExcelFormatter, "header_style")
+    except ImportError:
+        return False
+
+
+class ExcelReportWriter:
+    # 기존 방식: 시트 전체를 openpyxl 셀 객체로 만든 뒤 저장한다
+    def __init__(self, path):
+        self.path = path
+        self._writer = pd.ExcelWriter(path, engine="openpyxl")
+
+    def write_sheet(self, name, df):
+        for sheet_name, start, stop in sheet_parts(name, len(df)):
+            df.iloc[start:stop].to_excel(self._writer, sheet_name=sheet_name, index=False)
+
+    def copy_sheet(self, name, source):
+        # 이전 보고서(source)의 시트를 나뉜 모양 그대로 옮긴다
+        with pd.ExcelFile(source, engine="openpyxl") as previous:
+            for sheet_name in existing_parts(previous.sheet_names, name):
+                previous.parse(sheet_name).to_excel(self._writer, sheet_name=sheet_name, index=False)
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StreamingReportWriter:
+    """
+    openpyxl write-only 통합 문서에 시트를 행 단위로 흘려 쓴다.
+    셀 객체를 메모리에 쌓지 않으므로 보고서가 커져도 메모리 사용량이 거의 일정하다.
+    시트 모양(머리글, 날짜 표시 형식, 빈 값)은 DataFrame.to_excel(index=False) 과 같다.
+    Excel 행 제한을 넘는 시트는 쓰기 전에 나눠 이어지는 시트에 쓴다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._workbook = Workbook(write_only=True)
+        self._header_style = _pandas_styles_header()
+        self._sources = {}
+
+    def write_sheet(self, name, df):
+        for sheet_name, first, last in sheet_parts(name, len(df)):
+            ws = self._workbook.create_sheet(title=sheet_name)
+            ws.append([self._header_cell(ws, col) for col in df.columns])
+            for start in range(first, last, ROW_BLOCK):
+                block = df.iloc[start:min(start + ROW_BLOCK, last)]
+                columns = [self._cell_values(ws, block.iloc[:, i]) for i in range(block.shape[1])]
+                for row in zip(*columns):
+                    ws.append(row)
+
+    def copy_sheet(self, name, source):
+        # 이전 보고서(source)의 시트를 나뉜 모양 그대로 행 단위로 옮긴다 (read-only 로 읽어 메모리 일정)
+        if source not in self._sources:
+            self._sources[source] = load_workbook(source, read_only=True)
+        previous = self._sources[source]
+        for sheet_name in existing_parts(previous.sheetnames, name):
+            ws = self._workbook.create_sheet(title=sheet_name)
+            rows = previous[sheet_name].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is not None:
+                ws.append([self._header_cell(ws, value) for value in header])
+            for row in rows:
+                ws.append([self._copied_value(ws, value) for value in row])
+
+    def close(self):
+        self._workbook.save(self.path)
+        for previous in self._sources.values():
+            previous.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _header_cell(self, ws, value):
+        cell = WriteOnlyCell(ws, value=str(value))
+        if self._header_style:
+            thin = Side(style="thin")
+            cell.font = Font(bold=True)
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            cell.alignment = Alignment(horizontal="center", vertical="top")
+        return cell
+
+    @staticmethod
+    def _copied_value(ws, value):
+        if isinstance(value, datetime.datetime):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.number_format = DATETIME_FORMAT
+            return cell
+        return value
+
+    @staticmethod
+    def _cell_values(ws, series):
+        # 컬럼 하나를 파이썬 값 목록으로 바꾼다 (NaN/NaT 는 빈 셀)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            cells = []
+            for value in series.dt.to_pydatetime():
+                if pd.isna(value):
+                    cells.append(None)
+                else:
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.number_format = DATETIME_FORMAT
+                    cells.append(cell)
+            return cells
+        if pd.api.types.is_float_dtype(series):
+            values = series.to_numpy(dtype=float)
+            return [None if np.isnan(v) else v for v in values.tolist()]
+        return [None if v is None or (isinstance(v, float) and np.isnan(v)) else v for v in series.tolist()]
+
+
+def _sheet_file_name(name):
+    return INVALID_FILE_CHARS.sub("_", name)
+
+
+class CsvZipReportWriter:
+    # 시트마다 "<시트 이름>.csv" 하나를 zip 으로 묶는다 (행 제한 없음, 압축하며 바로 기록)
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    def write_sheet(self, name, df):
+        with self._zip.open(f"{_sheet_file_name(name)}.csv", "w", force_zip64=True) as raw:
+            with io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as f:
+                df.to_csv(f, index=False)
+
+    def copy_sheet(self, name, source):
+        entry = f"{_sheet_file_name(name)}.csv"
+        with zipfile.ZipFile(source) as previous:
+            if entry not in previous.namelist():
+                return
+            with previous.open(entry) as src, self._zip.open(entry, "w", force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst)
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ParquetReportWriter:
+    # path 폴더에 시트마다 "<시트 이름>.parquet" 하나씩 저장한다 (타입 그대로, 행 제한 없음)
+    def __init__(self, path):
+        self.path = path
+        self.written = set()
+        os.makedirs(path, exist_ok=True)
+
+    def write_sheet(self, name, df):
+        file_name = f"{_sheet_file_name(name)}.parquet"
+        df.to_parquet(os.path.join(self.path, file_name), index=False)
+        self.written.add(file_name)
+
+    def copy_sheet(self, name, source):
+        # 같은 폴더를 갱신할 때는 기존 파일을 그대로 둔다
+        file_name = f"{_sheet_file_name(name)}.parquet"
+        source_file = os.path.join(source, file_name)
+        if not os.path.exists(source_file):
+            return
+        if os.path.abspath(source) != os.path.abspath(self.path):
+            shutil.copyfile(source_file, os.path.join(self.path, file_name))
+        self.written.add(file_name)
+
+    def prune(self):
+        # 이번에 쓰거나 옮기지 않은 시트 파일(빠진 유닛/센서)을 지운다
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".parquet") and entry.name not in self.written:
+                os.remove(entry.path)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_report_writer(path, mode=DEFAULT_WRITER_MODE):
+    if mode == "streaming":
+        return StreamingReportWriter(path)
+    if mode == "openpyxl":
+        return ExcelReportWriter(path)
+    if mode == "csv-zip":
+        return CsvZipReportWriter(path)
+    if mode == "parquet":
+        return ParquetReportWriter(path)
+    raise ValueError(f"알 수 없는 보고서 저장 방식: {mode}")
@@ -9,16 +9,8 @@ from PyQt5.QtGui import QFont
 import pyqtgraph as pg
 import pyqtgraph.exporters  # PNG 내보내기
 
-def _read_csv_guess(path):
-    for enc in ["utf-8-sig", "cp949", "utf-8"]:
-        try:
-            return pd.read_csv(path, encoding=enc)
-        except Exception:
-            try:
-                return pd.read_csv(path, encoding=enc, sep=None, engine="python")
-            except Exception:
-                continue
-    raise RuntimeError(f"CSV를 읽을 수 없습니다: {path}")
+from src.calibration.data_loader import load_aircok_file
+from src.utils.file_cache import cached_read
 
 def _to_datetime_5min(series):
     dt = pd.to_datetime(series, errors="coerce")
@@ -75,8 +67,8 @@ def _plot_triple(plot, df, tcol, ref_col, raw_col, corr_col, title,
         if m.any():
             plot.plot(x[m], y[m], name=names[2], pen=PEN_CORR)
 
-def build_pm_series(grimm_file, aircok_file):
-    g = pd.read_csv(grimm_file, encoding='ISO-8859-1', skiprows=12, sep='\t', header=None)
+def _read_grimm(path):
+    g = pd.read_csv(path, encoding='ISO-8859-1', skiprows=12, sep='\t', header=None)
     g.columns = ['datetime', 'pm10', 'pm2.5', 'pm1', 'inhalable', 'thoracic', 'alveolic']
     g = g[['datetime', 'pm10', 'pm2.5']].rename(
         columns={'datetime': 'date', 'pm10': 'grimm_pm10', 'pm2.5': 'grimm_pm25'}
@@ -85,14 +77,21 @@ def build_pm_series(grimm_file, aircok_file):
     g['date'] = pd.to_datetime(g['date'], format='%Y-%m-%d %p %I:%M:%S', errors='coerce').dt.round('5min')
     g['grimm_pm25'] = pd.to_numeric(g['grimm_pm25'], errors='coerce')
     g['grimm_pm10'] = pd.to_numeric(g['grimm_pm10'], errors='coerce')
-    g = g.dropna()
+    return g.dropna()
+
+def _read_wolfsense(path):
+    w = pd.read_excel(path)
+    w = w[['Date Time','Carbon Dioxide ppm']].rename(columns={'Date Time':'date','Carbon Dioxide ppm':'co2'})
+    w['date'] = pd.to_datetime(w['date'], format='%Y-%m-%d %p %I:%M:%S')
+    w['date'] = w['date'].dt.round('5min')
+    w['co2']  = pd.to_numeric(w['co2'], errors="coerce").clip(lower=400)
+    return w
+
+def build_pm_series(grimm_file, aircok_file):
+    g = cached_read(grimm_file, _read_grimm, "graph-grimm")
 
-    a = _read_csv_guess(aircok_file)
-    a = a[['date', 'pm2.5', 'pm10']].copy()
-    a['date'] = pd.to_datetime(a['date'], errors='coerce')
-    a['pm2.5'] = pd.to_numeric(a['pm2.5'], errors='coerce')
-    a['pm10']  = pd.to_numeric(a['pm10'],  errors='coerce')
-    a = a.dropna()
+    # 보정과 같은 캐시 항목을 쓴다: date 는 datetime64, 센서 값은 숫자로 이미 바뀌어 있다
+    a = load_aircok_file(aircok_file)[['date', 'pm2.5', 'pm10']].dropna()
 
     m = pd.merge(g, a, on='date', how='inner').dropna().copy()
 
@@ -138,18 +137,16 @@ def load_testo_data(path):
     return df.dropna(subset=['date', 'humidity', 'temperature'])
 
 def build_temp_humi_series(testo_file, aircok_file):
-    t = load_testo_data(testo_file)
+    t = cached_read(testo_file, load_testo_data, "graph-testo")
 
-    a = _read_csv_guess(aircok_file)
+    a = load_aircok_file(aircok_file)
     required = {'date', 'temp', 'humi'}
     if not required.issubset(set(a.columns)):
         missing = required - set(a.columns)
         raise KeyError(f"Aircok 파일에 필요한 컬럼이 없습니다: {sorted(missing)}")
 
     a = a[['date', 'temp', 'humi']].copy()
-    a['date'] = pd.to_datetime(a['date'], errors='coerce').dt.round('5min')
-    a['temp'] = pd.to_numeric(a['temp'], errors='coerce')
-    a['humi'] = pd.to_numeric(a['humi'], errors='coerce')
+    a['date'] = a['date'].dt.round('5min')
     a = a.dropna(subset=['date', 'temp', 'humi'])
 
     m = pd.merge(t, a, on='date', how='inner').dropna().copy()
@@ -167,15 +164,10 @@ def build_temp_humi_series(testo_file, aircok_file):
     return m[['date','temperature','temp_raw','temp_corr','humidity','humi_raw','humi_corr']].copy()
 
 def build_co2_series(wolfsense_file, aircok_file):
-    w = pd.read_excel(wolfsense_file)
-    w = w[['Date Time','Carbon Dioxide ppm']].rename(columns={'Date Time':'date','Carbon Dioxide ppm':'co2'})
-    w['date'] = pd.to_datetime(w['date'], format='%Y-%m-%d %p %I:%M:%S')
-    w['date'] = w['date'].dt.round('5min')
-    w['co2']  = pd.to_numeric(w['co2'], errors="coerce").clip(lower=400)
+    w = cached_read(wolfsense_file, _read_wolfsense, "graph-wolfsense")
 
-    a = _read_csv_guess(aircok_file)[['date','co2']].copy()
-    a['date'] = pd.to_datetime(a['date'], errors='coerce')
-    a['co2']  = pd.to_numeric(a['co2'], errors="coerce").clip(lower=400)
+    a = load_aircok_file(aircok_file)[['date','co2']].copy()
+    a['co2']  = a['co2'].clip(lower=400)
 
     m = pd.merge(w, a, on='date', how='inner').dropna().copy()
     bias = (m['co2_x'] - m['co2_y']).mean()
@@ -0,0 +1,107 @@
+import hashlib
+import os
+import tempfile
+import pandas as pd
+
+from src.utils.table_io import is_binary_table
+
+# 선택적: pyarrow가 없으면 캐시 없이 매번 원본을 파싱
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except Exception:
+    HAS_PYARROW = False
+
+CACHE_VERSION = 2
+CACHE_ENABLED = True
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_SUFFIX = ".feather"
+
+
+def default_cache_dir():
+    base = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "AircokDataManager", "cache")
+
+CACHE_DIR = default_cache_dir()
+
+
+def cache_key(path, kind):
+    # 경로 + 크기 + 수정시각이 같으면 같은 파일로 본다. 파서가 바뀌면 CACHE_VERSION을 올린다.
+    st = os.stat(path)
+    raw = f"{CACHE_VERSION}|{kind}|{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def cached_read(path, loader, kind, cache_dir=None):
+    # Parquet / Feather 원본은 캐시보다 직접 읽는 편이 빠르다
+    if not (CACHE_ENABLED and HAS_PYARROW) or is_binary_table(path):
+        return loader(path)
+
+    cache_dir = cache_dir or CACHE_DIR
+    cache_file = os.path.join(cache_dir, cache_key(path, kind) + CACHE_SUFFIX)
+
+    if os.path.exists(cache_file):
+        try:
+            df = pd.read_feather(cache_file)
+            os.utime(cache_file)
+            return df
+        except Exception:
+            _remove_quietly(cache_file)
+
+    df = loader(path)
+    try:
+        _write_cache(df, cache_dir, cache_file)
+        evict_cache(cache_dir)
+    except Exception as e:
+        print(f"캐시 저장 실패: {path} ({e})")
+    return df
+
+
+def _write_cache(df, cache_dir, cache_file):
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.reset_index(drop=True).to_feather(tmp_path)
+        os.replace(tmp_path, cache_file)
+    except Exception:
+        _remove_quietly(tmp_path)
+        raise
+
+
+def evict_cache(cache_dir=None, max_bytes=None):
+    # 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 파일부터 지운다.
+    cache_dir = cache_dir or CACHE_DIR
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(CACHE_SUFFIX):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, file_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove_quietly(file_path)
+        total -= size
+
+
+def clear_cache(cache_dir=None):
+    # 캐시 파일을 모두 지우고 지운 개수를 돌려준다 (설정 메뉴의 "파일 캐시 비우기")
+    cache_dir = cache_dir or CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return 0
+    removed = 0
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(CACHE_SUFFIX):
+            removed += _remove_quietly(entry.path)
+    return removed
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,144 @@
+import os
+import numpy as np
+import pandas as pd
+
+# 선택적: pyarrow가 없으면 CSV만 쓰고 읽는다
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except Exception:
+    HAS_PYARROW = False
+
+# 저장 형식 → 확장자. parquet/feather 는 date 를 datetime64, 센서 값을 float32 로 저장한다.
+TABLE_FORMATS = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+BINARY_SUFFIXES = (".parquet", ".feather")
+LCD_LOG_SUFFIX = ".txt"
+FLOAT32_DIGITS = 6  # float32 로 저장한 값을 되돌릴 때 살리는 유효숫자 수
+
+
+def available_formats():
+    return [fmt for fmt in TABLE_FORMATS if fmt == "csv" or HAS_PYARROW]
+
+
+def is_binary_table(path):
+    return str(path).lower().endswith(BINARY_SUFFIXES)
+
+
+def is_lcd_log(path):
+    return str(path).lower().endswith(LCD_LOG_SUFFIX)
+
+
+def read_table(path, columns=None, **csv_kwargs):
+    """
+    CSV / Parquet / Feather / LCD 로그(.txt) 를 확장자로 구분해 읽는다. columns 는 read_csv 의 usecols 와 같다.
+    LCD 로그는 변환 CSV 를 거치지 않고 메모리에서 바로 파싱한다. CSV 가 아닐 때 csv_kwargs 는 무시한다.
+    """
+    lower = str(path).lower()
+    if lower.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    if lower.endswith(".feather"):
+        return pd.read_feather(path, columns=columns)
+    if lower.endswith(LCD_LOG_SUFFIX):
+        from src.modules.parsing.lcd_parser import read_lcd_log
+        df = read_lcd_log(path)
+        return df if columns is None else df[list(columns)]
+    return pd.read_csv(path, usecols=columns, **csv_kwargs)
+
+
+def read_sensor_csv(path, columns=None):
+    """
+    Aircok 형식 CSV(date + 센서 값)를 타입 추론 없이 읽는다: 센서 값은 float64 로 선언한다.
+    pyarrow 가 있으면 GIL 을 놓는 pyarrow 엔진으로 date 까지 datetime64 로 바로 읽으므로 여러 파일을 스레드로 동시에 읽을 수 있다.
+    날짜 형식이 다르거나 숫자가 아닌 값이 섞여 선언한 타입으로 읽을 수 없으면 기존처럼 추론해서 읽는다.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    date_dtype = "datetime64[ns]" if HAS_PYARROW else str
+    dtype = {col: (date_dtype if col == "date" else "float64") for col in header
+             if columns is None or col in columns}
+    try:
+        return pd.read_csv(path, usecols=columns, dtype=dtype, engine="pyarrow" if HAS_PYARROW else "c")
+    except (ValueError, TypeError):
+        return pd.read_csv(path, usecols=columns)
+
+
+def read_table_columns(path):
+    # 데이터를 읽지 않고 컬럼 이름만 얻는다 (LCD 로그는 변환 결과의 컬럼이 항상 같다)
+    lower = str(path).lower()
+    if lower.endswith(".parquet"):
+        return list(pq.read_schema(path).names)
+    if lower.endswith(".feather"):
+        with pa.memory_map(path) as source:
+            return list(pa.ipc.open_file(source).schema.names)
+    if lower.endswith(LCD_LOG_SUFFIX):
+        from src.modules.parsing.lcd_parser import COLUMNS
+        return list(COLUMNS)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def to_binary_frame(df):
+    # date 는 datetime64, 나머지 컬럼은 숫자로 바꿔 float32 로 맞춘다 (DB 의 Decimal 등 object 컬럼 포함)
+    out = pd.DataFrame(index=df.index)
+    for col in df.columns:
+        if col == "date":
+            out[col] = pd.to_datetime(df[col], errors="coerce")
+        else:
+            out[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    return out.reset_index(drop=True)
+
+
+def write_table(df, path):
+    fmt = os.path.splitext(path)[1].lower().lstrip(".")
+    if fmt == "parquet":
+        to_binary_frame(df).to_parquet(path, index=False)
+    elif fmt == "feather":
+        to_binary_frame(df).to_feather(path)
+    else:
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+    return path
+
+
+def float32_to_float64(values, digits=FLOAT32_DIGITS):
+    """
+    float32 값을 float64 로 바꾸면서 유효숫자 digits 자리로 반올림한다.
+    967.9 를 float32 로 저장하면 float64 에서는 967.9000244... 가 되므로, 보고서처럼 값을 그대로 보여줄 때 쓴다.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exp = np.floor(np.log10(np.abs(x)))
+    shift = np.where(np.isfinite(exp), digits - 1 - exp, 0)
+    # 10 의 음수 거듭제곱은 정확히 표현되지 않으므로 양수 거듭제곱으로 곱하거나 나눈다
+    up = 10.0 ** np.clip(shift, 0, None)
+    down = 10.0 ** np.clip(-shift, 0, None)
+    return np.round(x * up / down) * down / up
+
+
+def restore_float32_columns(df):
+    for col in df.columns:
+        if df[col].dtype == np.float32:
+            df[col] = float32_to_float64(df[col].to_numpy())
+    return df
+
+
+class BinaryTableWriter:
+    """
+    레코드를 Parquet / Feather 파일에 구간 단위로 이어 쓴다 (Parquet 는 row group, Feather 는 record batch).
+    모든 구간은 첫 구간의 스키마(date: timestamp, 센서: float32)를 따른다.
+    """
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.schema = pa.schema([("date", pa.timestamp("ns"))]
+                                + [(col, pa.float32()) for col in columns if col != "date"])
+        if path.lower().endswith(".parquet"):
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema,
+                                           options=pa.ipc.IpcWriteOptions(compression="lz4"))
+
+    def write(self, df):
+        table = pa.Table.from_pandas(to_binary_frame(df), schema=self.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        self._writer.close()